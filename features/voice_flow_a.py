@@ -23,11 +23,14 @@ Last touched: 2026-02-18 (response.create must request supported modalities; add
 from __future__ import annotations
 
 import asyncio
-import base64
+import binascii
+import contextlib
 import json
 import os
+import ssl
 import time
 from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any
 from urllib import request as urllib_request
@@ -46,14 +49,49 @@ router = APIRouter()
 TWILIO_SAMPLE_RATE_HZ = 8000
 FRAME_MS = 20
 FRAME_BYTES = int(TWILIO_SAMPLE_RATE_HZ * (FRAME_MS / 1000.0))  # 160
-FRAME_SLEEP_S = FRAME_MS / 1000.0
+FRAME_SLEEP_NS = FRAME_MS * 1_000_000
+# Sender lateness (loop stall) made up by sending back-to-back; beyond this the clock restarts from now.
+SENDER_CATCHUP_MAX_NS = 200 * 1_000_000
+MULAW_SILENCE_BYTE = b"\xff"
+# μ-law is one byte per 8 kHz sample: each byte is 125 µs of playout.
+MULAW_NS_PER_BYTE = FRAME_SLEEP_NS // FRAME_BYTES
 
 OPENAI_REALTIME_URL_BASE = "wss://api.openai.com/v1/realtime"
-
-
-def _dbg(msg: str) -> None:
+# Realtime deltas can be large JSON text frames; keep a generous but bounded receive limit.
+OPENAI_WS_MAX_SIZE = 16 * 1024 * 1024
+# One client TLS context for every call: ssl=True would rebuild it (and reload the CA bundle) per connect.
+OPENAI_SSL_CONTEXT = ssl.create_default_context()
+OPENAI_SSL_CONTEXT.set_alpn_protocols(["http/1.1"])
+# Non-audio event types the OpenAI reader acts on; anything else is skipped before the dispatch chain.
+OPENAI_HANDLED_EVENT_TYPES = frozenset(
+    {
+        "session.created",
+        "session.updated",
+        "error",
+        "input_audio_buffer.speech_started",
+        "input_audio_buffer.speech_stopped",
+        "conversation.item.input_audio_transcription.completed",
+        "response.created",
+        "response.output_text.delta",
+        "response.content_part.added",
+        "response.content_part.done",
+        "response.done",
+    }
+)
+# Fixed-content client events, serialized once at import.
+OPENAI_RESPONSE_CANCEL_TEXT = json.dumps({"type": "response.cancel"})
+OPENAI_INPUT_COMMIT_TEXT = json.dumps({"type": "input_audio_buffer.commit"})
+OPENAI_RESPONSE_CREATE_TEXT = json.dumps({"type": "response.create", "response": {"modalities": ["audio", "text"]}})
+_OPENAI_PARSED_EVENT_TYPES_B = frozenset(
+    t.encode("ascii")
+    for t in OPENAI_HANDLED_EVENT_TYPES | {"response.output_audio.delta", "response.audio.delta"}
+)
+
+
+def _dbg(msg: str, *args: object) -> None:
+    # Hot-path callers pass %-style args so nothing is formatted when debug is off.
     if is_debug():
-        logger.info(msg)
+        logger.info(msg, *args)
 
 
 def _env_int(name: str, default: int) -> int:
@@ -155,6 +193,24 @@ def _playout_low_water_frames(start_frames: int) -> int:
     return max(2, min(target, start_frames))
 
 
+def _adaptive_playout_start_enabled() -> bool:
+    return (os.getenv("VOICE_TWILIO_ADAPTIVE_START") or "0").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+
+def _high_water_drop_enabled() -> bool:
+    return (os.getenv("VOICE_TWILIO_HIGH_WATER_DROP") or "0").strip().lower() in (
+        "1",
+        "true",
+        "yes",
+        "on",
+    )
+
+
 def _playout_refill_hold_s() -> float:
     return max(0.0, _env_int("VOICE_TWILIO_REFILL_HOLD_MS", 0) / 1000.0)
 
@@ -200,6 +256,16 @@ def _twilio_chunk_frames() -> int:
     return max(1, ms // FRAME_MS)
 
 
+def _openai_append_batch_frames() -> int:
+    # Max queued Twilio media frames coalesced into one input_audio_buffer.append (1 disables).
+    return max(1, min(10, _env_int("VOICE_OPENAI_APPEND_BATCH", 4)))
+
+
+def _openai_append_linger_s() -> float:
+    # After the first inbound frame, wait this long for more before sending the append (0 = send what is queued).
+    return max(0, min(100, _env_int("VOICE_OPENAI_APPEND_LINGER_MS", 0))) / 1000.0
+
+
 def _twilio_mark_enabled() -> bool:
     return (os.getenv("VOICE_TWILIO_MARK_ENABLED") or "1").strip().lower() in (
         "1",
@@ -226,6 +292,89 @@ def _barge_in_context_note_text() -> str:
     )
 
 
+@dataclass(frozen=True, slots=True)
+class FlowAConfig:
+    """Env knobs read once per call so the audio loops use attribute access, not os.getenv."""
+
+    debug: bool
+    main_max_frames: int
+    minimal_hot_path: bool
+    chunk_mode: bool
+    chunk_frames: int
+    mark_enabled: bool
+    stats_every_s: float
+    stats_log_enabled: bool
+    diag_enabled: bool
+    prebuffer_frames: int
+    playout_start_frames: int
+    adaptive_start: bool
+    playout_low_water_frames: int
+    high_water_frames: int
+    playout_refill_hold_s: float
+    stall_warn_ms: float
+    stall_crit_ms: float
+    openai_append_batch_frames: int
+    openai_append_linger_s: float
+    speech_started_debounce_s: float
+    barge_in_min_response_ms: int
+    barge_in_min_frames: int
+    barge_in_context_note_enabled: bool
+    barge_in_context_note_text: str
+    flush_on_response_created: bool
+    force_input_commit_enabled: bool
+    force_input_commit_after_s: float
+    force_input_commit_min_frames: int
+    speech_ctrl_heartbeat_s: float
+    speech_ctrl_heartbeat_log_enabled: bool
+    intent_nlu_enabled: bool
+    customer_sms_followup_enabled: bool
+
+
+def _load_flow_a_config() -> FlowAConfig:
+    # Built per WebSocket session (not cached process-wide) so env changes apply to the next call.
+    main_max_frames = _env_int("VOICE_MAIN_MAX_FRAMES", 200)
+    prebuffer_frames = _effective_prebuffer_frames(main_max_frames)
+    playout_start_frames = _playout_start_frames(prebuffer_frames)
+    stall_warn_ms = max(20.0, _env_float("VOICE_SEND_STALL_WARN_MS", 35.0))
+    debug = is_debug()
+    return FlowAConfig(
+        debug=debug,
+        main_max_frames=main_max_frames,
+        minimal_hot_path=_minimal_hot_path_enabled(),
+        chunk_mode=_twilio_chunk_mode_enabled(),
+        chunk_frames=_twilio_chunk_frames(),
+        mark_enabled=_twilio_mark_enabled(),
+        stats_every_s=max(0.25, _env_int("VOICE_TWILIO_STATS_EVERY_MS", 1000) / 1000.0),
+        stats_log_enabled=_twilio_stats_log_enabled(),
+        # Audio-health diag only feeds debug logs; skip the per-frame work when nothing reads it.
+        diag_enabled=debug or _twilio_stats_log_enabled(),
+        prebuffer_frames=prebuffer_frames,
+        playout_start_frames=playout_start_frames,
+        adaptive_start=_adaptive_playout_start_enabled(),
+        playout_low_water_frames=_playout_low_water_frames(playout_start_frames),
+        # 0 disables; otherwise the sender drops oldest main frames above 90% of capacity.
+        high_water_frames=max(1, (main_max_frames * 9) // 10) if _high_water_drop_enabled() else 0,
+        playout_refill_hold_s=_playout_refill_hold_s(),
+        stall_warn_ms=stall_warn_ms,
+        stall_crit_ms=max(stall_warn_ms + 5.0, _env_float("VOICE_SEND_STALL_CRIT_MS", 60.0)),
+        openai_append_batch_frames=_openai_append_batch_frames(),
+        openai_append_linger_s=_openai_append_linger_s(),
+        speech_started_debounce_s=_speech_started_debounce_s(),
+        barge_in_min_response_ms=_barge_in_min_response_ms(),
+        barge_in_min_frames=_barge_in_min_frames(),
+        barge_in_context_note_enabled=_barge_in_context_note_enabled(),
+        barge_in_context_note_text=_barge_in_context_note_text(),
+        flush_on_response_created=_flush_on_response_created_enabled(),
+        force_input_commit_enabled=_force_input_commit_enabled(),
+        force_input_commit_after_s=_force_input_commit_after_s(),
+        force_input_commit_min_frames=_force_input_commit_min_frames(),
+        speech_ctrl_heartbeat_s=max(0.5, _env_int("VOICE_SPEECH_CTRL_HEARTBEAT_MS", 2000) / 1000.0),
+        speech_ctrl_heartbeat_log_enabled=_speech_ctrl_heartbeat_log_enabled(),
+        intent_nlu_enabled=_intent_nlu_enabled(),
+        customer_sms_followup_enabled=_customer_sms_followup_enabled(),
+    )
+
+
 def _sanitize_transcript_for_event(transcript: str, max_chars: int = 500) -> str:
     cleaned = " ".join(transcript.split()).strip()
     if not cleaned:
@@ -272,6 +421,50 @@ def _normalize_actor_mode(actor_mode: str | None) -> str:
     return mode if mode in {"client", "owner"} else "client"
 
 
+@dataclass(frozen=True, slots=True)
+class TwilioStart:
+    """Typed fields of a Twilio `start` event; non-string values are normalized to None."""
+
+    stream_sid: str | None
+    call_sid: str | None
+    rid: str | None
+    tenant_id: str | None
+    tenant_mode: str | None
+    ai_mode: str
+    from_number: str | None
+    to_number: str | None
+    custom: dict[str, Any]
+
+
+def _parse_twilio_start(evt: dict[str, Any]) -> TwilioStart:
+    start = evt.get("start")
+    get = start.get if isinstance(start, dict) else {}.get
+    custom = get("customParameters")
+    if not isinstance(custom, dict):
+        custom = {}
+    cget = custom.get
+
+    stream_sid = get("streamSid")
+    call_sid = get("callSid")
+    rid = cget("rid") or call_sid
+    tenant_id = cget("tenant_id")
+    tenant_mode = cget("tenant_mode")
+    ai_mode = cget("ai_mode")
+    from_number = cget("from_number")
+    to_number = cget("to_number")
+    return TwilioStart(
+        stream_sid=stream_sid if isinstance(stream_sid, str) else None,
+        call_sid=call_sid if isinstance(call_sid, str) else None,
+        rid=rid if isinstance(rid, str) else None,
+        tenant_id=tenant_id if isinstance(tenant_id, str) and tenant_id.strip() else None,
+        tenant_mode=tenant_mode if isinstance(tenant_mode, str) else None,
+        ai_mode=_normalize_ai_mode(ai_mode if isinstance(ai_mode, str) else None),
+        from_number=from_number if isinstance(from_number, str) else None,
+        to_number=to_number if isinstance(to_number, str) else None,
+        custom=custom,
+    )
+
+
 def _resolve_mode_instructions(ai_mode: str) -> str | None:
     raw_json = (os.getenv("VOZ_FLOW_A_MODE_INSTRUCTIONS_JSON") or "").strip()
     if raw_json:
@@ -733,6 +926,107 @@ class OutgoingAudioBuffers:
     aux: deque[bytes] = field(default_factory=deque)
     remainder: bytearray = field(default_factory=bytearray)
     main_max_frames: int = 200
+    # Set by ingest on every main-lane append so the sender wakes without polling.
+    main_ready: asyncio.Event = field(default_factory=asyncio.Event, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Bounded main lane: append past capacity drops the oldest frame in C.
+        self.main = deque(self.main, maxlen=max(1, self.main_max_frames))
+
+
+@dataclass(slots=True)
+class TurnLog:
+    """First-event breadcrumbs for one caller turn; replaced (not cleared) at speech_started."""
+
+    speech_started: bool = False
+    transcript: bool = False
+    response_create: bool = False
+    first_audio: bool = False
+    first_text: bool = False
+    first_main: bool = False
+
+
+class InboundMediaRing:
+    """Twilio media payloads bound for OpenAI; overwrites the oldest when full, one Event wakes the reader."""
+
+    __slots__ = ("_items", "_ready", "decode_drops", "overwrites")
+
+    def __init__(self, maxlen: int) -> None:
+        # maxlen <= 0 keeps the old unbounded asyncio.Queue(maxsize=0) behaviour.
+        self._items: deque[str] = deque(maxlen=maxlen if maxlen > 0 else None)
+        self._ready = asyncio.Event()
+        self.overwrites = 0
+        # Payloads dropped from a merged append because they were not valid base64.
+        self.decode_drops = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item: str) -> None:
+        items = self._items
+        if len(items) == items.maxlen:
+            self.overwrites += 1
+        items.append(item)
+        self._ready.set()
+
+    async def get_batch(self, max_items: int, linger_s: float = 0.0) -> list[str]:
+        """Wait for at least one payload, then take up to max_items (lingering up to linger_s for a short batch)."""
+        items = self._items
+        while not items:
+            self._ready.clear()
+            await self._ready.wait()
+        if linger_s > 0 and len(items) < max_items:
+            # Return as soon as the batch fills; the deadline only caps how long a short batch waits.
+            try:
+                async with asyncio.timeout(linger_s):
+                    while len(items) < max_items:
+                        self._ready.clear()
+                        await self._ready.wait()
+            except TimeoutError:
+                pass
+        pop = items.popleft
+        return [pop() for _ in range(min(max(1, max_items), len(items)))]
+
+
+class RidRing:
+    """Bounded set of recent response ids (oldest evicted); 64 is far past one call's in-flight horizon."""
+
+    __slots__ = ("_ids", "_maxlen")
+
+    def __init__(self, maxlen: int = 64) -> None:
+        self._ids: dict[str, None] = {}
+        self._maxlen = max(1, maxlen)
+
+    def __contains__(self, rid: object) -> bool:
+        return rid in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, rid: str) -> None:
+        if rid in self._ids:
+            return
+        self._ids[rid] = None
+        if len(self._ids) > self._maxlen:
+            del self._ids[next(iter(self._ids))]
+
+    def discard(self, rid: str) -> None:
+        self._ids.pop(rid, None)
+
+
+@dataclass(slots=True)
+class ResponseState:
+    """Per-call response bookkeeping shared by the OpenAI reader and the Twilio sender."""
+
+    active_response_id: str | None = None
+    turn_log: TurnLog = field(default_factory=TurnLog)
+    seen_audio_ids: RidRing = field(default_factory=RidRing)
+    logged_done_no_audio_ids: RidRing = field(default_factory=RidRing)
+    processed_response_done_ids: RidRing = field(default_factory=RidRing)
+    started_at_by_id: dict[str, float] = field(default_factory=dict)
+    sent_main_frames_by_id: dict[str, int] = field(default_factory=dict)
+    playout_started_ids: RidRing = field(default_factory=RidRing)
+    refill_wait_started_by_id: dict[str, int] = field(default_factory=dict)
 
 
 class WaitingAudioController:
@@ -754,9 +1048,48 @@ class WaitingAudioController:
         return self._aux_enabled
 
 
-def _build_twilio_media_msg(stream_sid: str, ulaw_frame: bytes) -> dict[str, Any]:
-    payload = base64.b64encode(ulaw_frame).decode("ascii")
-    return {"event": "media", "streamSid": stream_sid, "media": {"payload": payload}}
+class JitterEstimator:
+    """RTO-style EWMA (mean + k*dev) of response-audio playout lag, sizing the startup runway."""
+
+    def __init__(self, *, k: int = 4, min_frames: int = 4) -> None:
+        self._k = k
+        self._min_frames = min_frames
+        self._last_ns: int | None = None
+        self._last_audio_ns = 0
+        self._lag_ns = 0
+        self._mean_ns: int | None = None
+        self._dev_ns = 0
+
+    def on_response_start(self) -> None:
+        # The gap before a response's first delta is think time, not delivery jitter.
+        self._last_ns = None
+        self._lag_ns = 0
+
+    def observe(self, now_ns: int, bytes_len: int) -> None:
+        last = self._last_ns
+        carried_ns = self._last_audio_ns
+        self._last_ns = now_ns
+        self._last_audio_ns = bytes_len * MULAW_NS_PER_BYTE
+        if last is None:
+            return
+        # Lag a zero-runway playout would have by now: wall time the delivered audio did not cover.
+        # Small deltas at normal gaps build lag; audio arriving faster than real time pays it back.
+        lag = max(0, self._lag_ns + (now_ns - last) - carried_ns)
+        self._lag_ns = lag
+        if self._mean_ns is None:
+            self._mean_ns = lag
+            self._dev_ns = lag // 2
+            return
+        err = lag - self._mean_ns
+        self._mean_ns += err // 8
+        self._dev_ns += (abs(err) - self._dev_ns) // 4
+
+    def target_start_frames(self, max_frames: int) -> int:
+        if self._mean_ns is None:
+            return max_frames
+        budget_ns = self._mean_ns + self._k * self._dev_ns
+        frames = -(-budget_ns // FRAME_SLEEP_NS)
+        return max(self._min_frames, min(max_frames, frames))
 
 
 def _build_twilio_clear_msg(stream_sid: str) -> dict[str, Any]:
@@ -767,20 +1100,91 @@ def _build_twilio_mark_msg(stream_sid: str, name: str) -> dict[str, Any]:
     return {"event": "mark", "streamSid": stream_sid, "mark": {"name": name}}
 
 
+def _twilio_media_envelope(stream_sid: str) -> tuple[str, str]:
+    # Static JSON around the base64 payload, built once per SID so frames skip dict + json.dumps.
+    return f'{{"event":"media","streamSid":{json.dumps(stream_sid)},"media":{{"payload":"', '"}}'
+
+
+def _twilio_mark_prefix(stream_sid: str) -> str:
+    # Sender marks are named m<seq>; callers append the counter and '"}}'.
+    return f'{{"event":"mark","streamSid":{json.dumps(stream_sid)},"mark":{{"name":"m'
+
+
+def _twilio_clear_text(stream_sid: str) -> str:
+    # Pre-serialized form of _build_twilio_clear_msg for the barge-in path.
+    return f'{{"event":"clear","streamSid":{json.dumps(stream_sid)}}}'
+
+
 def _chunk_to_frames(remainder: bytearray, chunk: bytes, *, frame_bytes: int = FRAME_BYTES) -> list[bytes]:
+    if not remainder and chunk:
+        # Common case: no carry-over, so slice the delta itself and keep only its tail.
+        end = len(chunk) - (len(chunk) % frame_bytes)
+        with memoryview(chunk) as mv:
+            out = [mv[i : i + frame_bytes].tobytes() for i in range(0, end, frame_bytes)]
+            if end < len(chunk):
+                remainder.extend(mv[end:])
+        return out
     if chunk:
         remainder.extend(chunk)
-    out: list[bytes] = []
-    while len(remainder) >= frame_bytes:
-        out.append(bytes(remainder[:frame_bytes]))
-        del remainder[:frame_bytes]
+    end = len(remainder) - (len(remainder) % frame_bytes)
+    if not end:
+        return []
+    # Slice frames through one view, then drop them with a single del (no per-frame tail shift).
+    with memoryview(remainder) as mv:
+        out = [mv[i : i + frame_bytes].tobytes() for i in range(0, end, frame_bytes)]
+    del remainder[:end]
     return out
 
 
+def _openai_append_text(audio_b64: str) -> str:
+    # Static envelope around the payload; json.dumps on the str alone still escapes caller-supplied input.
+    return f'{{"type":"input_audio_buffer.append","audio":{json.dumps(audio_b64)}}}'
+
+
+def _openai_message_item_text(role: str, text: str) -> str:
+    return json.dumps(
+        {
+            "type": "conversation.item.create",
+            "item": {
+                "type": "message",
+                "role": role,
+                "content": [{"type": "input_text", "text": text}],
+            },
+        }
+    )
+
+
+def _coalesce_b64_audio(payloads: list[str]) -> tuple[str, int]:
+    """Merge payloads into one base64 append; also returns how many failed to decode and were dropped."""
+    if len(payloads) == 1:
+        return payloads[0], 0
+    # Only unpadded base64 concatenates as text; 160-byte μ-law frames end in "==".
+    if not any(p.endswith("=") for p in payloads[:-1]):
+        return "".join(payloads), 0
+    raw = bytearray()
+    dropped = 0
+    for p in payloads:
+        try:
+            raw += binascii.a2b_base64(p)
+        except binascii.Error:
+            dropped += 1
+    return binascii.b2a_base64(raw, newline=False).decode("ascii"), dropped
+
+
 def _audio_queue_bytes(buffers: OutgoingAudioBuffers) -> int:
+    # O(1): lanes only hold fixed FRAME_BYTES frames, so deque lengths stand in for a byte counter.
     return (len(buffers.main) * FRAME_BYTES) + (len(buffers.aux) * FRAME_BYTES) + len(buffers.remainder)
 
 
+async def _wait_for_main_audio(buffers: OutgoingAudioBuffers, timeout_s: float) -> None:
+    """Sleep up to timeout_s, returning early once ingest appends main-lane audio."""
+    ready = buffers.main_ready
+    ready.clear()
+    with contextlib.suppress(TimeoutError):
+        async with asyncio.timeout(timeout_s):
+            await ready.wait()
+
+
 def _flush_output_audio_buffers(buffers: OutgoingAudioBuffers) -> int:
     dropped = _audio_queue_bytes(buffers)
     buffers.main.clear()
@@ -789,46 +1193,109 @@ def _flush_output_audio_buffers(buffers: OutgoingAudioBuffers) -> int:
     return dropped
 
 
-def _diag_init() -> dict[str, int]:
-    return {
-        "frames": 0,
-        "delta_chunks": 0,
-        "bytes": 0,
-        "same_as_prev_frames": 0,
-        "same_run_max": 0,
-        "same_run_cur": 0,
-        "low_diversity_frames": 0,
-        "silence_like_frames": 0,
-    }
+def _pad_out_partial_frame(buffers: OutgoingAudioBuffers) -> bool:
+    """Queue the sub-frame tail left after a response's last delta, padded to a full frame with μ-law silence."""
+    tail = buffers.remainder
+    if not tail:
+        return False
+    tail.extend(MULAW_SILENCE_BYTE * (FRAME_BYTES - len(tail)))
+    buffers.main.append(bytes(tail))
+    tail.clear()
+    buffers.main_ready.set()
+    return True
+
+
+@dataclass(slots=True)
+class AudioDiag:
+    """Per-response audio-health counters (debug/stats only)."""
+
+    frames: int = 0
+    delta_chunks: int = 0
+    bytes: int = 0
+    same_as_prev_frames: int = 0
+    same_run_max: int = 0
+    same_run_cur: int = 0
+    low_diversity_frames: int = 0
+    silence_like_frames: int = 0
+
+
+def _byte_diversity(frame: bytes) -> int:
+    # Distinct byte values, capped at 3 (scoring only asks <=1 / <=2); C-level counts, no set().
+    if not frame:
+        return 0
+    first = frame[:1]
+    n_first = frame.count(first)
+    if n_first == len(frame):
+        return 1
+    second = frame.lstrip(first)[:1]
+    return 2 if n_first + frame.count(second) == len(frame) else 3
 
 
-def _diag_update_frame(diag: dict[str, int], frame: bytes, prev_frame: bytes | None) -> bool:
-    diag["frames"] += 1
-    diag["bytes"] += len(frame)
+def _diag_update_frame(diag: AudioDiag, frame: bytes, prev_frame: bytes | None) -> bool:
+    diag.frames += 1
+    diag.bytes += len(frame)
 
-    uniq = len(set(frame))
+    uniq = _byte_diversity(frame)
     if uniq <= 2:
-        diag["low_diversity_frames"] += 1
+        diag.low_diversity_frames += 1
     if uniq <= 1:
-        diag["silence_like_frames"] += 1
+        diag.silence_like_frames += 1
 
     same_as_prev = prev_frame == frame and prev_frame is not None
     if same_as_prev:
-        diag["same_as_prev_frames"] += 1
-        diag["same_run_cur"] += 1
+        diag.same_as_prev_frames += 1
+        diag.same_run_cur += 1
     else:
-        diag["same_run_cur"] = 1
-    if diag["same_run_cur"] > diag["same_run_max"]:
-        diag["same_run_max"] = diag["same_run_cur"]
+        diag.same_run_cur = 1
+    diag.same_run_max = max(diag.same_run_max, diag.same_run_cur)
     return same_as_prev
 
 
-def _diag_score(diag: dict[str, int]) -> str:
-    frames = max(1, int(diag.get("frames", 0)))
-    same_ratio = float(diag.get("same_as_prev_frames", 0)) / float(frames)
-    low_div_ratio = float(diag.get("low_diversity_frames", 0)) / float(frames)
-    silence_ratio = float(diag.get("silence_like_frames", 0)) / float(frames)
-    same_run_max = int(diag.get("same_run_max", 0))
+def _diag_update_frames(diag: AudioDiag, frames: list[bytes], prev_frame: bytes | None) -> bytes | None:
+    """Batch _diag_update_frame over one delta's frames; returns the new previous frame."""
+    if not frames:
+        return prev_frame
+    low_div = silence = same = n_bytes = 0
+    run_cur = diag.same_run_cur
+    run_max = diag.same_run_max
+    prev = prev_frame
+    for frame in frames:
+        n_bytes += len(frame)
+        uniq = _byte_diversity(frame)
+        if uniq <= 2:
+            low_div += 1
+            if uniq <= 1:
+                silence += 1
+        if frame == prev:
+            same += 1
+            run_cur += 1
+        else:
+            run_cur = 1
+        run_max = max(run_max, run_cur)
+        prev = frame
+    diag.frames += len(frames)
+    diag.bytes += n_bytes
+    diag.low_diversity_frames += low_div
+    diag.silence_like_frames += silence
+    diag.same_as_prev_frames += same
+    diag.same_run_cur = run_cur
+    diag.same_run_max = run_max
+    return prev
+
+
+def _diag_ratios(diag: AudioDiag) -> tuple[float, float, float]:
+    """(same_as_prev, low_diversity, silence_like) as fractions of frames."""
+    frames = float(max(1, diag.frames))
+    return (
+        diag.same_as_prev_frames / frames,
+        diag.low_diversity_frames / frames,
+        diag.silence_like_frames / frames,
+    )
+
+
+def _diag_score(diag: AudioDiag) -> str:
+    same_ratio, low_div_ratio, silence_ratio = _diag_ratios(diag)
+    same_run_max = diag.same_run_max
 
     if (same_ratio > 0.85 and same_run_max >= 80) or silence_ratio > 0.95:
         return "bad"
@@ -848,27 +1315,21 @@ def _should_accept_response_audio(*, response_id: str | None, active_response_id
 def _barge_in_allowed(
     *,
     active_response_id: str | None,
-    response_started_at: dict[str, float],
-    response_state: dict[str, Any],
+    response_state: ResponseState,
     now_monotonic: float,
     min_response_ms: int,
     min_frames: int,
 ) -> bool:
-    if not isinstance(active_response_id, str) or not active_response_id:
+    if not active_response_id:
         return False
-    started = response_started_at.get(active_response_id)
-    age_ms = int((now_monotonic - started) * 1000.0) if isinstance(started, float) else 0
-    sent_frames = 0
-    sent_map = response_state.get("sent_main_frames_by_id")
-    if isinstance(sent_map, dict):
-        raw = sent_map.get(active_response_id, 0)
-        sent_frames = int(raw) if isinstance(raw, int | float) else 0
+    started = response_state.started_at_by_id.get(active_response_id)
+    age_ms = int((now_monotonic - started) * 1000.0) if started is not None else 0
+    sent_frames = response_state.sent_main_frames_by_id.get(active_response_id, 0)
     return age_ms >= max(0, min_response_ms) and sent_frames >= max(0, min_frames)
 
 
-def _is_sender_underrun_state(*, response_state: dict[str, Any], buffers: OutgoingAudioBuffers) -> bool:
-    active = response_state.get("active_response_id")
-    if isinstance(active, str) and active:
+def _is_sender_underrun_state(*, response_state: ResponseState, buffers: OutgoingAudioBuffers) -> bool:
+    if response_state.active_response_id:
         return True
     # If there are playable main frames queued, sender should not be idle.
     return bool(buffers.main)
@@ -910,41 +1371,146 @@ def _event_emit_enabled() -> bool:
     return env_flag("VOZ_FLOW_A_EVENT_EMIT")
 
 
-async def _emit_flow_a_event(
+FlowAEventArgs = tuple[str, str, str, dict[str, Any], None, str | None]
+
+
+def _flow_a_event_args(
     *,
-    enabled: bool,
     tenant_id: str | None,
     rid: str | None,
     event_type: str,
     payload: dict[str, Any],
     idempotency_key: str | None = None,
-) -> None:
-    if not enabled:
-        return
-
+) -> FlowAEventArgs | None:
     tenant = (tenant_id or "").strip()
     request_id = (rid or "").strip()
     if not tenant or not request_id:
-        _dbg(f"FLOW_A_EVENT_SKIPPED type={event_type} reason=missing_context")
-        return
+        _dbg("FLOW_A_EVENT_SKIPPED type=%s reason=missing_context", event_type)
+        return None
 
-    event_payload = dict(payload)
-    event_payload.setdefault("tenant_id", tenant)
-    event_payload.setdefault("rid", request_id)
+    # Callers build a fresh dict per event and hand it over, so fill it in place instead of copying.
+    payload.setdefault("tenant_id", tenant)
+    payload.setdefault("rid", request_id)
+    return (tenant, request_id, event_type, payload, None, idempotency_key)
 
-    try:
-        await asyncio.to_thread(
-            core_db.emit_event,
-            tenant,
-            request_id,
-            event_type,
-            event_payload,
-            None,
-            idempotency_key,
+
+def _write_flow_a_events(batch: list[FlowAEventArgs]) -> None:
+    # Runs in a worker thread; each event is written (and fails) independently.
+    for args in batch:
+        tenant, request_id, event_type = args[0], args[1], args[2]
+        try:
+            core_db.emit_event(*args)
+            _dbg("FLOW_A_EVENT_EMITTED type=%s tenant_id=%s rid=%s", event_type, tenant, request_id)
+        except Exception as e:
+            _dbg(
+                "FLOW_A_EVENT_EMIT_FAILED type=%s tenant_id=%s rid=%s err=%r",
+                event_type,
+                tenant,
+                request_id,
+                e,
+            )
+
+
+class FlowAEventQueue:
+    """Per-call flow_a.* events in emit order; one worker writes each pending batch in a single thread hop."""
+
+    __slots__ = ("_closed", "_enabled", "_items", "_ready", "dropped")
+
+    def __init__(self, *, enabled: bool, maxlen: int = 256) -> None:
+        self._enabled = enabled
+        self._items: deque[FlowAEventArgs] = deque(maxlen=max(1, maxlen))
+        self._ready = asyncio.Event()
+        self._closed = False
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def emit(
+        self,
+        *,
+        tenant_id: str | None,
+        rid: str | None,
+        event_type: str,
+        payload: dict[str, Any],
+        idempotency_key: str | None = None,
+    ) -> None:
+        """Queue an event without awaiting the DB; drops the oldest pending event when full.
+
+        Takes ownership of ``payload``: it is written later by the worker, so never pass a reused dict.
+        """
+        if not self._enabled:
+            return
+        args = _flow_a_event_args(
+            tenant_id=tenant_id,
+            rid=rid,
+            event_type=event_type,
+            payload=payload,
+            idempotency_key=idempotency_key,
         )
-        _dbg(f"FLOW_A_EVENT_EMITTED type={event_type} tenant_id={tenant} rid={request_id}")
-    except Exception as e:
-        _dbg(f"FLOW_A_EVENT_EMIT_FAILED type={event_type} tenant_id={tenant} rid={request_id} err={e!r}")
+        if args is None:
+            return
+        items = self._items
+        if len(items) == items.maxlen:
+            self.dropped += 1
+        items.append(args)
+        self._ready.set()
+
+    def close(self) -> None:
+        """Let run() return once everything queued so far is written."""
+        self._closed = True
+        self._ready.set()
+
+    async def run(self) -> None:
+        items = self._items
+        while True:
+            if not items:
+                if self._closed:
+                    return
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            batch = list(items)
+            items.clear()
+            await asyncio.to_thread(_write_flow_a_events, batch)
+
+
+def _openai_event_skippable(raw: bytes | str) -> bool:
+    """True when the frame leads with a "type" the reader ignores, so json.loads can be skipped."""
+    head = raw[:128]
+    if isinstance(head, str):
+        head = head.encode("utf-8")
+    # Only trust a top-level leading "type"; any other layout falls through to a full parse.
+    if not head.startswith(b'{"type":"'):
+        return False
+    end = head.find(b'"', 9)
+    if end < 0:
+        return False
+    return head[9:end] not in _OPENAI_PARSED_EVENT_TYPES_B
+
+
+def _twilio_media_payload(raw: str) -> str | None:
+    """Base64 payload of a Twilio media frame found by str.find, or None when json.loads is needed."""
+    head = raw[:24]
+    if '"event"' not in head or '"media"' not in head:
+        return None
+    key = raw.find('"payload"')
+    if key < 0:
+        return None
+    start = raw.find('"', key + 9)
+    # Only ':' (and optional spaces) may sit between the key and an opening quote.
+    if start < 0 or raw[key + 9 : start].strip() != ":":
+        return None
+    end = raw.find('"', start + 1)
+    if end < 0:
+        return None
+    payload = raw[start + 1 : end]
+    # Base64 never needs JSON escapes; anything escaped takes the full-parse path.
+    return None if "\\" in payload else payload
 
 
 async def _connect_openai_ws(*, model: str) -> Any:
@@ -976,426 +1542,376 @@ async def _connect_openai_ws(*, model: str) -> Any:
         kwargs["headers"] = hdrs
     elif "header" in params:
         kwargs["header"] = [f"{k}: {v}" for k, v in hdrs]
+    if "max_size" in params:
+        kwargs["max_size"] = OPENAI_WS_MAX_SIZE
+    # Passed through **kwargs to loop.create_connection on every websockets version.
+    kwargs["ssl"] = OPENAI_SSL_CONTEXT
 
     return await websockets.connect(url, **kwargs)
 
 
+def _ws_recv_supports_raw(ws: Any) -> bool:
+    """True when ws.recv(decode=False) can return text frames as bytes (skips the UTF-8 decode)."""
+    import inspect
+
+    try:
+        return "decode" in inspect.signature(ws.recv).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+async def _twilio_writer_loop(*, websocket: WebSocket, out_q: asyncio.Queue[str]) -> None:
+    """Sole writer for the Twilio socket; media and control producers only enqueue text frames."""
+    try:
+        while True:
+            msg = await out_q.get()
+            await websocket.send_text(msg)
+    except Exception as e:
+        _dbg("TWILIO_WRITER_FAILED err=%r", e)
+        raise
+
+
+def _cancel_on_failure(target: asyncio.Task[Any]) -> Callable[[asyncio.Task[Any]], None]:
+    """Done callback: a task that dies with an error cancels target instead of failing unnoticed."""
+
+    def _on_done(task: asyncio.Task[Any]) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            target.cancel()
+
+    return _on_done
+
+
+@dataclass(slots=True)
+class SenderStats:
+    """Twilio sender counters for one stats interval (integer ns; converted to ms only when logged)."""
+
+    started_ns: int
+    frames_sent: int = 0
+    underruns: int = 0
+    idle_ticks: int = 0
+    prebuf_waits: int = 0
+    late_ns_max: int = 0
+    idle_late_ns_max: int = 0
+    send_stall_warn_count: int = 0
+    send_stall_crit_count: int = 0
+    send_gap_ns_max: int = 0
+
+    def reset(self, now_ns: int) -> None:
+        self.started_ns = now_ns
+        self.frames_sent = 0
+        self.underruns = 0
+        self.idle_ticks = 0
+        self.prebuf_waits = 0
+        self.late_ns_max = 0
+        self.idle_late_ns_max = 0
+        self.send_stall_warn_count = 0
+        self.send_stall_crit_count = 0
+        self.send_gap_ns_max = 0
+
+    def log_line(self, *, q_bytes: int, prebuf: bool, jitter_target_ms: int) -> str:
+        return (
+            f"twilio_send stats: q_bytes={q_bytes} "
+            f"frames_sent={self.frames_sent} underruns={self.underruns} idle_ticks={self.idle_ticks} "
+            f"prebuf_waits={self.prebuf_waits} "
+            f"late_ms_max={self.late_ns_max / 1e6:.1f} prebuf={prebuf} "
+            f"idle_late_ms_max={self.idle_late_ns_max / 1e6:.1f} "
+            f"send_gap_ms_max={self.send_gap_ns_max / 1e6:.1f} "
+            f"send_stall_warn_count={self.send_stall_warn_count} "
+            f"send_stall_crit_count={self.send_stall_crit_count} "
+            f"jitter_buffer_target_ms={jitter_target_ms}"
+        )
+
+
+def _drop_main_to_high_water(
+    *, buffers: OutgoingAudioBuffers, response_state: ResponseState, rid: str, high_water_frames: int
+) -> None:
+    # Catch up to real time: a short glitch beats letting caller-side latency grow.
+    drop = len(buffers.main) - high_water_frames
+    pop = buffers.main.popleft
+    for _ in range(drop):
+        pop()
+    sent_map = response_state.sent_main_frames_by_id
+    sent_map[rid] = sent_map.get(rid, 0) + drop
+    _dbg("TWILIO_ADAPTIVE_DROP n=%d response_id=%s q_main=%d", drop, rid, len(buffers.main))
+
+
 async def _twilio_sender_loop(
     *,
-    websocket: WebSocket,
-    send_lock: asyncio.Lock,
+    out_q: asyncio.Queue[str],
     stream_sid_ref: dict[str, str | None],
     buffers: OutgoingAudioBuffers,
     wait_ctl: WaitingAudioController,
-    response_state: dict[str, Any],
+    response_state: ResponseState,
+    cfg: FlowAConfig,
+    jitter: JitterEstimator,
 ) -> None:
     """Send frames to Twilio at ~20ms pacing. Prefer main lane, then aux."""
-    minimal_hot_path = _minimal_hot_path_enabled()
-    chunk_mode = _twilio_chunk_mode_enabled()
-    chunk_frames = _twilio_chunk_frames()
-    mark_enabled = _twilio_mark_enabled()
-    stats_every_s = max(0.25, _env_int("VOICE_TWILIO_STATS_EVERY_MS", 1000) / 1000.0)
-    prebuffer_frames = _effective_prebuffer_frames(buffers.main_max_frames)
-    playout_start_frames = _playout_start_frames(prebuffer_frames)
-    playout_low_water_frames = _playout_low_water_frames(playout_start_frames)
-    playout_refill_hold_s = _playout_refill_hold_s()
-    stall_warn_ms = max(20.0, _env_float("VOICE_SEND_STALL_WARN_MS", 35.0))
-    stall_crit_ms = max(stall_warn_ms + 5.0, _env_float("VOICE_SEND_STALL_CRIT_MS", 60.0))
-    stats_log_enabled = _twilio_stats_log_enabled()
-    stats_started = time.monotonic()
-    frames_sent = 0
-    underruns = 0
-    idle_ticks = 0
-    prebuf_waits = 0
-    late_ms_max = 0.0
-    idle_late_ms_max = 0.0
-    send_stall_warn_count = 0
-    send_stall_crit_count = 0
-    send_gap_ms_max = 0.0
-    next_due = time.monotonic() + FRAME_SLEEP_S
-    last_send_ts: float | None = None
+    # Chunk mode wins over the minimal hot path, which only replaces frame mode.
+    if cfg.minimal_hot_path and not cfg.chunk_mode:
+        await _twilio_minimal_sender_loop(
+            out_q=out_q,
+            stream_sid_ref=stream_sid_ref,
+            buffers=buffers,
+            wait_ctl=wait_ctl,
+            response_state=response_state,
+            cfg=cfg,
+        )
+        return
+
+    # Frame mode is chunk mode with one frame per send (and no marks); both share one pacing path.
+    frames_per_send = cfg.chunk_frames if cfg.chunk_mode else 1
+    send_marks = cfg.mark_enabled and cfg.chunk_mode
+    # Integer nanosecond clock: one monotonic_ns() read per decision, converted to ms only for logs.
+    stats_every_ns = int(cfg.stats_every_s * 1_000_000_000)
+    prebuffer_frames = cfg.prebuffer_frames
+    playout_start_frames = cfg.playout_start_frames
+    adaptive_start = cfg.adaptive_start
+    start_frames_rid: str | None = None
+    playout_low_water_frames = cfg.playout_low_water_frames
+    high_water_frames = cfg.high_water_frames
+    refill_hold_ns = int(cfg.playout_refill_hold_s * 1_000_000_000)
+    stall_warn_ns = int(cfg.stall_warn_ms * 1_000_000)
+    stall_crit_ns = int(cfg.stall_crit_ms * 1_000_000)
+    # Stats lines only reach the log in debug mode; skip building them otherwise.
+    stats_log_enabled = cfg.stats_log_enabled and cfg.debug
+    monotonic_ns = time.monotonic_ns
+    stats = SenderStats(started_ns=monotonic_ns())
+    next_due = stats.started_ns + FRAME_SLEEP_NS
+    # base64.b64encode is a Python wrapper over this; call the C function directly per frame.
+    b2a_base64 = binascii.b2a_base64
+    last_send_ts: int | None = None
     last_send_rid: str | None = None
     prebuf_complete_logged_for_rid: str | None = None
-    prebuf_open_for_rid: str | None = None
     sid_for_fast_json: str | None = None
     fast_json_prefix = ""
     fast_json_suffix = '"}}'
+    mark_json_prefix = ""
     mark_seq = 0
+    # Set by waits that hold audio back; the next send restarts pacing instead of catching up the wait.
+    restart_clock = False
 
     while True:
         sid = stream_sid_ref.get("streamSid")
         if not sid:
+            restart_clock = True
             await asyncio.sleep(0.01)
             continue
-        if minimal_hot_path and sid != sid_for_fast_json:
+        if sid != sid_for_fast_json:
             sid_for_fast_json = sid
-            # Fast path: avoid json.dumps per frame by reusing static envelope pieces.
-            fast_json_prefix = f'{{"event":"media","streamSid":"{sid}","media":{{"payload":"'
-
-        frame: bytes | None = None
-        lane = "none"
-        rid_for_send: str | None = None
-
-        if chunk_mode:
-            chunk_parts: list[bytes] = []
-            if buffers.main:
-                lane = "main"
-                rid_for_send = response_state.get("active_response_id")
-                rid = rid_for_send if isinstance(rid_for_send, str) else None
-                done_ids = response_state.get("processed_response_done_ids")
-                playout_started_ids = response_state.get("playout_started_ids")
-                refill_wait_started_by_id = response_state.get("refill_wait_started_by_id")
-                rid_done = isinstance(done_ids, set) and isinstance(rid, str) and rid in done_ids
-                if isinstance(rid, str) and rid and isinstance(playout_started_ids, set):
-                    # Startup runway: chunk mode must honor the same startup guard as frame mode.
-                    if rid not in playout_started_ids and not rid_done and len(buffers.main) < playout_start_frames:
-                        prebuf_waits += 1
-                        last_send_ts = None
-                        last_send_rid = None
-                        await asyncio.sleep(0.01)
-                        continue
-                    if rid not in playout_started_ids:
-                        playout_started_ids.add(rid)
-                    # Mid-turn refill hysteresis: hold briefly if queue dipped too low.
-                    if (
-                        not rid_done
-                        and len(buffers.main) < playout_low_water_frames
-                        and isinstance(refill_wait_started_by_id, dict)
-                        and playout_refill_hold_s > 0.0
-                    ):
-                        now = time.monotonic()
-                        started = refill_wait_started_by_id.get(rid)
-                        if not isinstance(started, float):
-                            refill_wait_started_by_id[rid] = now
-                            prebuf_waits += 1
-                            await asyncio.sleep(0.01)
-                            continue
-                        if (now - started) < playout_refill_hold_s:
-                            prebuf_waits += 1
-                            await asyncio.sleep(0.01)
-                            continue
-                        refill_wait_started_by_id.pop(rid, None)
-                    elif isinstance(refill_wait_started_by_id, dict):
-                        refill_wait_started_by_id.pop(rid, None)
-                n = min(chunk_frames, len(buffers.main))
-                for _ in range(n):
-                    chunk_parts.append(buffers.main.popleft())
-            elif wait_ctl.aux_enabled and buffers.aux:
-                lane = "aux"
-                n = min(chunk_frames, len(buffers.aux))
-                for _ in range(n):
-                    chunk_parts.append(buffers.aux.popleft())
-
-            if not chunk_parts:
-                last_send_ts = None
-                last_send_rid = None
-                if _is_sender_underrun_state(response_state=response_state, buffers=buffers):
-                    underruns += 1
-                else:
-                    idle_ticks += 1
-                now = time.monotonic()
-                if now >= next_due:
-                    idle_late_ms_max = max(idle_late_ms_max, (now - next_due) * 1000.0)
-                    next_due = now + FRAME_SLEEP_S
-                if now - stats_started >= stats_every_s:
-                    if stats_log_enabled:
-                        prebuf = bool(response_state.get("active_response_id")) and len(buffers.main) < prebuffer_frames
-                        _dbg(
-                            f"twilio_send stats: q_bytes={_audio_queue_bytes(buffers)} "
-                            f"frames_sent={frames_sent} underruns={underruns} idle_ticks={idle_ticks} "
-                            f"prebuf_waits={prebuf_waits} "
-                            f"late_ms_max={late_ms_max:.1f} prebuf={prebuf} "
-                            f"idle_late_ms_max={idle_late_ms_max:.1f} "
-                            f"send_gap_ms_max={send_gap_ms_max:.1f} "
-                            f"send_stall_warn_count={send_stall_warn_count} "
-                            f"send_stall_crit_count={send_stall_crit_count}"
-                        )
-                    stats_started = now
-                    frames_sent = 0
-                    underruns = 0
-                    idle_ticks = 0
-                    prebuf_waits = 0
-                    late_ms_max = 0.0
-                    idle_late_ms_max = 0.0
-                    send_stall_warn_count = 0
-                    send_stall_crit_count = 0
-                    send_gap_ms_max = 0.0
-                await asyncio.sleep(0.01)
-                continue
-
-            chunk_bytes = b"".join(chunk_parts)
-            now = time.monotonic()
-            if now >= next_due:
-                late_ms_max = max(late_ms_max, (now - next_due) * 1000.0)
-            if isinstance(last_send_ts, float) and isinstance(rid_for_send, str) and rid_for_send == last_send_rid:
-                send_gap_ms = (now - last_send_ts) * 1000.0
-                send_gap_ms_max = max(send_gap_ms_max, send_gap_ms)
-                if send_gap_ms > stall_warn_ms:
-                    send_stall_warn_count += 1
-                if send_gap_ms > stall_crit_ms:
-                    send_stall_crit_count += 1
-            elif lane != "main":
-                last_send_ts = None
-                last_send_rid = None
-            msg = _build_twilio_media_msg(sid, chunk_bytes)
-            async with send_lock:
-                await websocket.send_text(json.dumps(msg))
-                if mark_enabled and lane == "main":
-                    mark_seq += 1
-                    await websocket.send_text(
-                        json.dumps(_build_twilio_mark_msg(sid, f"m{mark_seq}"))
-                    )
-
-            if lane == "main" and isinstance(rid_for_send, str):
-                sent_map = response_state.get("sent_main_frames_by_id")
-                if isinstance(sent_map, dict):
-                    cur = sent_map.get(rid_for_send, 0)
-                    sent_map[rid_for_send] = int(cur) + len(chunk_parts)
-                last_send_ts = now
-                last_send_rid = rid_for_send
-                if prebuf_open_for_rid != rid_for_send:
-                    prebuf_open_for_rid = rid_for_send
-                if rid_for_send != prebuf_complete_logged_for_rid and len(buffers.main) >= prebuffer_frames:
-                    _dbg("Prebuffer complete; starting to send audio to Twilio")
-                    prebuf_complete_logged_for_rid = rid_for_send
-                logged_main_ids = response_state.get("logged_twilio_main_frame_ids")
-                if isinstance(logged_main_ids, set) and rid_for_send not in logged_main_ids:
-                    _dbg(
-                        f"TWILIO_MAIN_FRAME_SENT first=1 response_id={rid_for_send} "
-                        f"bytes={len(chunk_bytes)} q_main={len(buffers.main)}"
-                    )
-                    logged_main_ids.add(rid_for_send)
-            else:
-                last_send_ts = None
-                last_send_rid = None
-
-            frames_sent += len(chunk_parts)
-            if now - stats_started >= stats_every_s:
-                if stats_log_enabled:
-                    prebuf = bool(response_state.get("active_response_id")) and len(buffers.main) < prebuffer_frames
-                    _dbg(
-                        f"twilio_send stats: q_bytes={_audio_queue_bytes(buffers)} "
-                        f"frames_sent={frames_sent} underruns={underruns} idle_ticks={idle_ticks} "
-                        f"prebuf_waits={prebuf_waits} "
-                        f"late_ms_max={late_ms_max:.1f} prebuf={prebuf} "
-                        f"idle_late_ms_max={idle_late_ms_max:.1f} "
-                        f"send_gap_ms_max={send_gap_ms_max:.1f} "
-                        f"send_stall_warn_count={send_stall_warn_count} "
-                        f"send_stall_crit_count={send_stall_crit_count}"
-                    )
-                stats_started = now
-                frames_sent = 0
-                underruns = 0
-                idle_ticks = 0
-                prebuf_waits = 0
-                late_ms_max = 0.0
-                idle_late_ms_max = 0.0
-                send_stall_warn_count = 0
-                send_stall_crit_count = 0
-                send_gap_ms_max = 0.0
-
-            # Chunk mode still uses a stable 20ms/frame playout clock.
-            next_due = next_due + (FRAME_SLEEP_S * len(chunk_parts))
-            sleep_s = next_due - time.monotonic()
-            if sleep_s > 0:
-                await asyncio.sleep(sleep_s)
-            else:
-                next_due = time.monotonic() + FRAME_SLEEP_S
-            continue
-
-        if minimal_hot_path:
-            if buffers.main:
-                frame = buffers.main.popleft()
-                lane = "main"
-                rid_for_send = response_state.get("active_response_id")
-            elif wait_ctl.aux_enabled and buffers.aux:
-                frame = buffers.aux.popleft()
-                lane = "aux"
-
-            if frame is None:
-                await asyncio.sleep(0.005)
-                continue
-
-            payload = base64.b64encode(frame).decode("ascii")
-            msg = f"{fast_json_prefix}{payload}{fast_json_suffix}"
-            async with send_lock:
-                await websocket.send_text(msg)
-
-            if lane == "main" and isinstance(rid_for_send, str):
-                sent_map = response_state.get("sent_main_frames_by_id")
-                if isinstance(sent_map, dict):
-                    cur = sent_map.get(rid_for_send, 0)
-                    sent_map[rid_for_send] = int(cur) + 1
-
-            next_due = next_due + FRAME_SLEEP_S
-            sleep_s = next_due - time.monotonic()
-            if sleep_s > 0:
-                await asyncio.sleep(sleep_s)
-            else:
-                next_due = time.monotonic() + FRAME_SLEEP_S
-            continue
+            # Avoid json.dumps per frame by reusing static envelope pieces.
+            fast_json_prefix, fast_json_suffix = _twilio_media_envelope(sid)
+            mark_json_prefix = _twilio_mark_prefix(sid)
+
+        # One read of the active response per tick; the reader may swap it while we await.
+        rid = response_state.active_response_id
+        if adaptive_start and rid != start_frames_rid:
+            # Size this response's startup runway from observed delta jitter, capped at the configured one.
+            start_frames_rid = rid
+            playout_start_frames = jitter.target_start_frames(cfg.playout_start_frames)
+        if high_water_frames and rid and len(buffers.main) > high_water_frames:
+            _drop_main_to_high_water(
+                buffers=buffers,
+                response_state=response_state,
+                rid=rid,
+                high_water_frames=high_water_frames,
+            )
 
+        # One clock read per tick: nothing awaits between here and the send accounting below.
+        now = monotonic_ns()
+        parts: list[bytes] = []
+        main_lane = False
         if buffers.main:
-            lane = "main"
-            rid = response_state.get("active_response_id")
-            done_ids = response_state.get("processed_response_done_ids")
-            playout_started_ids = response_state.get("playout_started_ids")
-            refill_wait_started_by_id = response_state.get("refill_wait_started_by_id")
-            rid_done = isinstance(done_ids, set) and isinstance(rid, str) and rid in done_ids
-            if isinstance(rid, str) and rid and isinstance(playout_started_ids, set):
+            main_lane = True
+            if rid:
+                playout_started_ids = response_state.playout_started_ids
+                refill_wait_started_by_id = response_state.refill_wait_started_by_id
+                rid_done = rid in response_state.processed_response_done_ids
                 # Startup runway: do not start sending until a small buffer is ready.
                 if rid not in playout_started_ids and not rid_done and len(buffers.main) < playout_start_frames:
-                    prebuf_waits += 1
+                    stats.prebuf_waits += 1
                     last_send_ts = None
                     last_send_rid = None
-                    await asyncio.sleep(0.01)
+                    restart_clock = True
+                    await _wait_for_main_audio(buffers, 0.01)
                     continue
                 if rid not in playout_started_ids:
                     playout_started_ids.add(rid)
                 # Mid-turn refill hysteresis: short hold when buffer dips too low.
-                if (
-                    not rid_done
-                    and len(buffers.main) < playout_low_water_frames
-                    and isinstance(refill_wait_started_by_id, dict)
-                    and playout_refill_hold_s > 0.0
-                ):
-                    now = time.monotonic()
+                if not rid_done and len(buffers.main) < playout_low_water_frames and refill_hold_ns > 0:
                     started = refill_wait_started_by_id.get(rid)
-                    if not isinstance(started, float):
+                    if started is None:
                         refill_wait_started_by_id[rid] = now
-                        prebuf_waits += 1
-                        await asyncio.sleep(0.01)
+                        stats.prebuf_waits += 1
+                        restart_clock = True
+                        await _wait_for_main_audio(buffers, 0.01)
                         continue
-                    if (now - started) < playout_refill_hold_s:
-                        prebuf_waits += 1
-                        await asyncio.sleep(0.01)
+                    if (now - started) < refill_hold_ns:
+                        stats.prebuf_waits += 1
+                        restart_clock = True
+                        await _wait_for_main_audio(buffers, 0.01)
                         continue
                     refill_wait_started_by_id.pop(rid, None)
-                elif isinstance(refill_wait_started_by_id, dict):
+                else:
                     refill_wait_started_by_id.pop(rid, None)
-            frame = buffers.main.popleft()
-            lane = "main"
+            pop = buffers.main.popleft
+            parts = [pop() for _ in range(min(frames_per_send, len(buffers.main)))]
         elif wait_ctl.aux_enabled and buffers.aux:
-            frame = buffers.aux.popleft()
-            lane = "aux"
-        else:
+            pop = buffers.aux.popleft
+            parts = [pop() for _ in range(min(frames_per_send, len(buffers.aux)))]
+
+        if not parts:
             last_send_ts = None
             last_send_rid = None
             if _is_sender_underrun_state(response_state=response_state, buffers=buffers):
-                underruns += 1
+                stats.underruns += 1
             else:
-                idle_ticks += 1
-            now = time.monotonic()
+                stats.idle_ticks += 1
             if now >= next_due:
-                idle_late_ms_max = max(idle_late_ms_max, (now - next_due) * 1000.0)
-                next_due = now + FRAME_SLEEP_S
-            if now - stats_started >= stats_every_s:
-                if stats_log_enabled:
-                    prebuf = bool(response_state.get("active_response_id")) and len(buffers.main) < prebuffer_frames
-                    _dbg(
-                        f"twilio_send stats: q_bytes={_audio_queue_bytes(buffers)} "
-                        f"frames_sent={frames_sent} underruns={underruns} idle_ticks={idle_ticks} "
-                        f"prebuf_waits={prebuf_waits} "
-                        f"late_ms_max={late_ms_max:.1f} prebuf={prebuf} "
-                        f"idle_late_ms_max={idle_late_ms_max:.1f} "
-                        f"send_gap_ms_max={send_gap_ms_max:.1f} "
-                        f"send_stall_warn_count={send_stall_warn_count} "
-                        f"send_stall_crit_count={send_stall_crit_count}"
-                    )
-                stats_started = now
-                frames_sent = 0
-                underruns = 0
-                idle_ticks = 0
-                prebuf_waits = 0
-                late_ms_max = 0.0
-                idle_late_ms_max = 0.0
-                send_stall_warn_count = 0
-                send_stall_crit_count = 0
-                send_gap_ms_max = 0.0
-            await asyncio.sleep(0.01)
-            continue
-
-        now = time.monotonic()
-        if now >= next_due:
-            late_ms_max = max(late_ms_max, (now - next_due) * 1000.0)
-        rid_for_send = response_state.get("active_response_id") if lane == "main" else None
-        if isinstance(last_send_ts, float) and isinstance(rid_for_send, str) and rid_for_send == last_send_rid:
-            send_gap_ms = (now - last_send_ts) * 1000.0
-            send_gap_ms_max = max(send_gap_ms_max, send_gap_ms)
-            if send_gap_ms > stall_warn_ms:
-                send_stall_warn_count += 1
-            if send_gap_ms > stall_crit_ms:
-                send_stall_crit_count += 1
-        elif lane != "main":
-            last_send_ts = None
-            last_send_rid = None
-
-        # Send immediately, then sleep to pace.
-        msg = _build_twilio_media_msg(sid, frame)
-        async with send_lock:
-            await websocket.send_text(json.dumps(msg))
-        frames_sent += 1
-        if isinstance(rid_for_send, str):
-            last_send_ts = now
-            last_send_rid = rid_for_send
+                stats.idle_late_ns_max = max(stats.idle_late_ns_max, now - next_due)
+                next_due = now + FRAME_SLEEP_NS
         else:
-            last_send_ts = None
-            last_send_rid = None
-
-        if lane == "main":
-            rid = response_state.get("active_response_id")
-            if isinstance(rid, str):
-                sent_map = response_state.get("sent_main_frames_by_id")
-                if isinstance(sent_map, dict):
-                    current = sent_map.get(rid, 0)
-                    if isinstance(current, int):
-                        sent_map[rid] = current + 1
-                    else:
-                        sent_map[rid] = 1
-                if prebuf_open_for_rid != rid:
-                    prebuf_open_for_rid = rid
-                if rid != prebuf_complete_logged_for_rid and len(buffers.main) >= prebuffer_frames:
+            audio = parts[0] if len(parts) == 1 else b"".join(parts)
+            if restart_clock:
+                # The runway/refill just built must play out at 20ms/frame, not as back-to-back catch-up sends.
+                next_due = now
+                restart_clock = False
+            if now >= next_due:
+                stats.late_ns_max = max(stats.late_ns_max, now - next_due)
+            rid_for_send = rid if main_lane else None
+            if last_send_ts is not None and rid_for_send is not None and rid_for_send == last_send_rid:
+                send_gap_ns = now - last_send_ts
+                stats.send_gap_ns_max = max(stats.send_gap_ns_max, send_gap_ns)
+                if send_gap_ns > stall_warn_ns:
+                    stats.send_stall_warn_count += 1
+                if send_gap_ns > stall_crit_ns:
+                    stats.send_stall_crit_count += 1
+
+            if rid_for_send is not None:
+                # Credit before put() can suspend: response.done may pop this rid's entry meanwhile.
+                sent_map = response_state.sent_main_frames_by_id
+                sent_map[rid_for_send] = sent_map.get(rid_for_send, 0) + len(parts)
+
+            # Send immediately, then sleep to pace.
+            payload = b2a_base64(audio, newline=False).decode("ascii")
+            await out_q.put(f"{fast_json_prefix}{payload}{fast_json_suffix}")
+            if send_marks and main_lane:
+                mark_seq += 1
+                await out_q.put(f'{mark_json_prefix}{mark_seq}"}}}}')
+
+            if rid_for_send is not None:
+                last_send_ts = now
+                last_send_rid = rid_for_send
+                if rid_for_send != prebuf_complete_logged_for_rid and len(buffers.main) >= prebuffer_frames:
                     _dbg("Prebuffer complete; starting to send audio to Twilio")
-                    prebuf_complete_logged_for_rid = rid
-                logged_main_ids = response_state.get("logged_twilio_main_frame_ids")
-                if isinstance(logged_main_ids, set) and rid not in logged_main_ids:
+                    prebuf_complete_logged_for_rid = rid_for_send
+                turn_log = response_state.turn_log
+                if not turn_log.first_main:
                     _dbg(
-                        f"TWILIO_MAIN_FRAME_SENT first=1 response_id={rid} bytes={len(frame)} q_main={len(buffers.main)}"
+                        "TWILIO_MAIN_FRAME_SENT first=1 response_id=%s bytes=%d q_main=%d",
+                        rid_for_send,
+                        len(audio),
+                        len(buffers.main),
                     )
-                    logged_main_ids.add(rid)
+                    turn_log.first_main = True
+            else:
+                last_send_ts = None
+                last_send_rid = None
+            stats.frames_sent += len(parts)
 
-        if now - stats_started >= stats_every_s:
+        if now - stats.started_ns >= stats_every_ns:
             if stats_log_enabled:
-                prebuf = bool(response_state.get("active_response_id")) and len(buffers.main) < prebuffer_frames
                 _dbg(
-                    f"twilio_send stats: q_bytes={_audio_queue_bytes(buffers)} "
-                    f"frames_sent={frames_sent} underruns={underruns} idle_ticks={idle_ticks} "
-                    f"prebuf_waits={prebuf_waits} "
-                    f"late_ms_max={late_ms_max:.1f} prebuf={prebuf} "
-                    f"idle_late_ms_max={idle_late_ms_max:.1f} "
-                    f"send_gap_ms_max={send_gap_ms_max:.1f} "
-                    f"send_stall_warn_count={send_stall_warn_count} "
-                    f"send_stall_crit_count={send_stall_crit_count}"
+                    stats.log_line(
+                        q_bytes=_audio_queue_bytes(buffers),
+                        prebuf=bool(rid) and len(buffers.main) < prebuffer_frames,
+                        jitter_target_ms=playout_start_frames * FRAME_MS,
+                    )
                 )
-            stats_started = now
-            frames_sent = 0
-            underruns = 0
-            idle_ticks = 0
-            prebuf_waits = 0
-            late_ms_max = 0.0
-            idle_late_ms_max = 0.0
-            send_stall_warn_count = 0
-            send_stall_crit_count = 0
-            send_gap_ms_max = 0.0
-
-        # Keep a stable 20ms playout clock to normalize bursty producer output.
-        next_due = next_due + FRAME_SLEEP_S
-        sleep_s = next_due - time.monotonic()
-        if sleep_s > 0:
-            await asyncio.sleep(sleep_s)
+            stats.reset(now)
+
+        if not parts:
+            await _wait_for_main_audio(buffers, 0.01)
+            continue
+
+        # Keep a stable 20ms/frame playout clock to normalize bursty producer output.
+        next_due = next_due + (FRAME_SLEEP_NS * len(parts))
+        after = monotonic_ns()
+        sleep_ns = next_due - after
+        if sleep_ns > 0:
+            await asyncio.sleep(sleep_ns / 1e9)
+        elif sleep_ns > -SENDER_CATCHUP_MAX_NS:
+            # Briefly behind: keep the schedule so the caller's playout lead refills, but still yield.
+            await asyncio.sleep(0)
+        else:
+            _dbg("TWILIO_SENDER_CLOCK_RESET behind_ms=%d", -sleep_ns // 1_000_000)
+            next_due = after + FRAME_SLEEP_NS
+
+
+async def _twilio_minimal_sender_loop(
+    *,
+    out_q: asyncio.Queue[str],
+    stream_sid_ref: dict[str, str | None],
+    buffers: OutgoingAudioBuffers,
+    wait_ctl: WaitingAudioController,
+    response_state: ResponseState,
+    cfg: FlowAConfig,
+) -> None:
+    """VOICE_TWILIO_MINIMAL_HOT_PATH (frame mode only): one frame per tick, no playout gates, marks or stats."""
+    high_water_frames = cfg.high_water_frames
+    monotonic_ns = time.monotonic_ns
+    next_due = monotonic_ns() + FRAME_SLEEP_NS
+    # base64.b64encode is a Python wrapper over this; call the C function directly per frame.
+    b2a_base64 = binascii.b2a_base64
+    sid_for_fast_json: str | None = None
+    fast_json_prefix = ""
+    fast_json_suffix = '"}}'
+
+    while True:
+        sid = stream_sid_ref.get("streamSid")
+        if not sid:
+            await asyncio.sleep(0.01)
+            continue
+        if sid != sid_for_fast_json:
+            sid_for_fast_json = sid
+            fast_json_prefix, fast_json_suffix = _twilio_media_envelope(sid)
+
+        rid = response_state.active_response_id
+        if high_water_frames and rid and len(buffers.main) > high_water_frames:
+            _drop_main_to_high_water(
+                buffers=buffers,
+                response_state=response_state,
+                rid=rid,
+                high_water_frames=high_water_frames,
+            )
+
+        rid_for_send: str | None = None
+        if buffers.main:
+            frame = buffers.main.popleft()
+            rid_for_send = rid
+        elif wait_ctl.aux_enabled and buffers.aux:
+            frame = buffers.aux.popleft()
+        else:
+            await _wait_for_main_audio(buffers, 0.005)
+            continue
+
+        if rid_for_send is not None:
+            # Credit before put() can suspend: response.done may pop this rid's entry meanwhile.
+            sent_map = response_state.sent_main_frames_by_id
+            sent_map[rid_for_send] = sent_map.get(rid_for_send, 0) + 1
+
+        payload = b2a_base64(frame, newline=False).decode("ascii")
+        await out_q.put(f"{fast_json_prefix}{payload}{fast_json_suffix}")
+
+        next_due = next_due + FRAME_SLEEP_NS
+        after = monotonic_ns()
+        sleep_ns = next_due - after
+        if sleep_ns > 0:
+            await asyncio.sleep(sleep_ns / 1e9)
+        elif sleep_ns > -SENDER_CATCHUP_MAX_NS:
+            await asyncio.sleep(0)
         else:
-            # If behind schedule, reset to now so we do not drift indefinitely.
-            next_due = time.monotonic() + FRAME_SLEEP_S
+            _dbg("TWILIO_SENDER_CLOCK_RESET behind_ms=%d", -sleep_ns // 1_000_000)
+            next_due = after + FRAME_SLEEP_NS
 
 
 @router.websocket("/twilio/stream")
@@ -1407,24 +1923,38 @@ async def twilio_stream(websocket: WebSocket) -> None:
     await websocket.accept()
     _dbg("TWILIO_WS_CONNECTED")
 
-    send_lock = asyncio.Lock()
-    stream_sid_ref: dict[str, str | None] = {"streamSid": None}
+    cfg = _load_flow_a_config()
+    # Same note on every barge-in; serialize it once per call.
+    barge_in_note_text = (
+        _openai_message_item_text("system", cfg.barge_in_context_note_text)
+        if cfg.barge_in_context_note_enabled
+        else None
+    )
+
+    # Single-writer discipline: only the writer task touches the Twilio socket.
+    twilio_out_q_max = max(4, _env_int("VOICE_TWILIO_OUT_Q_MAX", 64))
+    twilio_out_q: asyncio.Queue[str] = asyncio.Queue(maxsize=twilio_out_q_max)
+    # clearText caches the pre-serialized Twilio clear for the current streamSid.
+    stream_sid_ref: dict[str, str | None] = {"streamSid": None, "clearText": None}
 
-    buffers = OutgoingAudioBuffers(main_max_frames=_env_int("VOICE_MAIN_MAX_FRAMES", 200))
+    buffers = OutgoingAudioBuffers(main_max_frames=cfg.main_max_frames)
     wait_ctl = WaitingAudioController()
+    jitter = JitterEstimator()
 
     # OpenAI bridge state
     bridge_enabled = env_flag("VOZ_FLOW_A_OPENAI_BRIDGE")
     model = _env_str("VOZ_OPENAI_REALTIME_MODEL", "gpt-realtime")
     voice, instructions = _resolve_actor_mode_policy(None, None)
     q_max = _env_int("VOICE_OPENAI_IN_Q_MAX", 200)
-    in_q: asyncio.Queue[str] = asyncio.Queue(maxsize=q_max)
+    in_q = InboundMediaRing(q_max)
 
     openai_ws: Any = None
+    writer_task: asyncio.Task | None = None
     sender_task: asyncio.Task | None = None
     in_task: asyncio.Task | None = None
     out_task: asyncio.Task | None = None
     heartbeat_task: asyncio.Task | None = None
+    events_task: asyncio.Task | None = None
     openai_input_blocked_unknown_param = False
     logged_session_created = False
     logged_session_updated = False
@@ -1432,23 +1962,9 @@ async def twilio_stream(websocket: WebSocket) -> None:
     logged_mode_selection = False
 
     active_response_id: str | None = None
-    response_state: dict[str, Any] = {
-        "active_response_id": None,
-        "logged_delta_ids": set(),
-        "logged_text_delta_ids": set(),
-        "seen_audio_ids": set(),
-        "logged_twilio_main_frame_ids": set(),
-        "logged_done_no_audio_ids": set(),
-        "processed_response_done_ids": set(),
-        "sent_main_frames_by_id": {},
-        "playout_started_ids": set(),
-        "refill_wait_started_by_id": {},
-    }
+    response_state = ResponseState()
 
     turn_seq = 0
-    turn_logged_speech_started = False
-    turn_logged_transcript = False
-    turn_logged_response_create = False
     call_tenant_id: str | None = None
     call_tenant_mode: str | None = None
     call_ai_mode: str = "customer"
@@ -1457,8 +1973,9 @@ async def twilio_stream(websocket: WebSocket) -> None:
     call_stream_sid: str | None = None
     call_from_number: str | None = None
     call_to_number: str | None = None
-    event_emit_enabled = _event_emit_enabled()
+    flow_a_events = FlowAEventQueue(enabled=_event_emit_enabled())
     call_stopped_emitted = False
+    call_stopped_idem_key: str | None = None
     emitted_intent_event_keys: set[str] = set()
     emitted_owner_goal_event_keys: set[str] = set()
     last_speech_started_ts: float | None = None
@@ -1469,30 +1986,24 @@ async def twilio_stream(websocket: WebSocket) -> None:
     last_media_rx_ts: float | None = None
     ws_started_at = time.monotonic()
     logged_media_absent = False
-    response_started_at: dict[str, float] = {}
-    response_audio_diag: dict[str, dict[str, int]] = {}
+    response_audio_diag: dict[str, AudioDiag] = {}
     response_last_frame: dict[str, bytes] = {}
 
-    def _drop_oldest_put(item: str) -> None:
-        try:
-            in_q.put_nowait(item)
-        except asyncio.QueueFull:
-            try:
-                in_q.get_nowait()
-            except Exception:
-                pass
-            try:
-                in_q.put_nowait(item)
-            except Exception:
-                pass
-
     async def _twilio_to_openai_loop() -> None:
         nonlocal openai_input_blocked_unknown_param
+        batch_max = cfg.openai_append_batch_frames
+        linger_s = cfg.openai_append_linger_s
         while True:
-            audio_b64 = await in_q.get()
+            batch = await in_q.get_batch(batch_max, linger_s)
             if openai_input_blocked_unknown_param:
                 continue
-            await openai_ws.send(json.dumps({"type": "input_audio_buffer.append", "audio": audio_b64}))
+            audio_b64, dropped = _coalesce_b64_audio(batch)
+            if dropped:
+                in_q.decode_drops += dropped
+                _dbg("TWILIO_MEDIA_DECODE_DROPPED frames=%d batch=%d", dropped, len(batch))
+            if not audio_b64:
+                continue
+            await openai_ws.send(_openai_append_text(audio_b64))
 
     def _normalize_modalities(x: Any) -> list[str] | None:
         if not isinstance(x, list) or not x:
@@ -1503,47 +2014,119 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 out.append(v)
         return out or None
 
+    def _ingest_response_audio(
+        audio_b64: str,
+        evt_rid: Any,
+        *,
+        first_label: str = "OPENAI_AUDIO_DELTA_FIRST",
+        first_extra: str = "",
+    ) -> None:
+        """Decode one response audio payload into the main lane (shared by delta and content-part events)."""
+        response_id = evt_rid if isinstance(evt_rid, str) and evt_rid else None
+        if not _should_accept_response_audio(
+            response_id=response_id,
+            active_response_id=active_response_id,
+        ):
+            _dbg(
+                "OPENAI_AUDIO_DROPPED response_id=%s active_response_id=%s",
+                response_id,
+                active_response_id,
+            )
+            return
+        try:
+            # Inline C decode (~1 µs per 160 B): cheaper than any executor hop, and skips b64decode's wrapper.
+            chunk = binascii.a2b_base64(audio_b64)
+        except Exception:
+            return
+
+        if cfg.adaptive_start:
+            jitter.observe(time.monotonic_ns(), len(chunk))
+        frames = _chunk_to_frames(buffers.remainder, chunk)
+        if frames:
+            buffers.main.extend(frames)
+            buffers.main_ready.set()
+
+        rid = response_id or active_response_id
+        if rid is None:
+            return
+        if cfg.diag_enabled:
+            diag = response_audio_diag.get(rid)
+            if diag is None:
+                diag = response_audio_diag[rid] = AudioDiag()
+            diag.delta_chunks += 1
+            prev = _diag_update_frames(diag, frames, response_last_frame.get(rid))
+            if prev is not None:
+                response_last_frame[rid] = prev
+
+        response_state.seen_audio_ids.add(rid)
+
+        turn_log = response_state.turn_log
+        if not turn_log.first_audio:
+            _dbg("%s response_id=%s bytes=%d%s", first_label, rid, len(chunk), first_extra)
+            turn_log.first_audio = True
+
     async def _openai_to_twilio_loop() -> None:
         nonlocal logged_session_created, logged_session_updated, openai_input_blocked_unknown_param
         nonlocal active_response_id, openai_output_modalities
-        nonlocal turn_seq, turn_logged_speech_started, turn_logged_transcript, turn_logged_response_create
+        nonlocal turn_seq
         nonlocal last_speech_started_ts
         nonlocal pending_speech_started_at, pending_speech_started_media_frames, pending_input_commit_sent
 
+        monotonic = time.monotonic
+        # json.loads parses bytes directly, so skip websockets' per-frame UTF-8 decode when possible.
+        recv_raw = _ws_recv_supports_raw(openai_ws)
         while True:
-            raw = await openai_ws.recv()
+            raw = await (openai_ws.recv(decode=False) if recv_raw else openai_ws.recv())
+            # Transcript deltas arrive alongside every audio delta; drop them (and other ignored types) unparsed.
+            if _openai_event_skippable(raw):
+                continue
             evt = json.loads(raw)
             etype = evt.get("type")
 
+            # Steady state is almost entirely audio deltas; test for them before the setup/teardown chain.
+            if etype == "response.output_audio.delta" or etype == "response.audio.delta":
+                delta_b64 = evt.get("delta")
+                if isinstance(delta_b64, str) and delta_b64:
+                    _ingest_response_audio(delta_b64, evt.get("response_id"))
+                continue
+            # Transcript deltas, rate limits, item lifecycle, etc.: nothing below handles them.
+            if etype not in OPENAI_HANDLED_EVENT_TYPES:
+                continue
+
             if etype == "session.created":
-                session = evt.get("session") if isinstance(evt.get("session"), dict) else {}
+                session_raw = evt.get("session")
+                session = session_raw if isinstance(session_raw, dict) else {}
                 om = session.get("output_modalities") or session.get("modalities")
                 openai_output_modalities = _normalize_modalities(om) or openai_output_modalities
                 if not logged_session_created:
                     _dbg(
-                        f"OPENAI_SESSION_CREATED keys={list(session.keys())} "
-                        f"output_modalities={openai_output_modalities}"
+                        "OPENAI_SESSION_CREATED keys=%s output_modalities=%s",
+                        list(session.keys()),
+                        openai_output_modalities,
                     )
                     logged_session_created = True
                 continue
 
             if etype == "session.updated":
-                session = evt.get("session") if isinstance(evt.get("session"), dict) else {}
+                session_raw = evt.get("session")
+                session = session_raw if isinstance(session_raw, dict) else {}
                 om = session.get("output_modalities") or session.get("modalities")
                 openai_output_modalities = _normalize_modalities(om) or openai_output_modalities
                 if not logged_session_updated:
                     _dbg(
-                        f"OPENAI_SESSION_UPDATED keys={list(session.keys())} "
-                        f"output_modalities={openai_output_modalities}"
+                        "OPENAI_SESSION_UPDATED keys=%s output_modalities=%s",
+                        list(session.keys()),
+                        openai_output_modalities,
                     )
                     logged_session_updated = True
                 continue
 
             if etype == "error":
-                err = evt.get("error")
-                code = err.get("code") if isinstance(err, dict) else None
-                param = err.get("param") if isinstance(err, dict) else None
-                msg = err.get("message") if isinstance(err, dict) else None
+                err_raw = evt.get("error")
+                err = err_raw if isinstance(err_raw, dict) else {}
+                code = err.get("code")
+                param = err.get("param")
+                msg = err.get("message")
 
                 if code == "unknown_parameter":
                     openai_input_blocked_unknown_param = True
@@ -1551,27 +2134,31 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 # If server rejects modalities, force the known-supported audio+text combo.
                 if code == "invalid_value" and param == "response.modalities":
                     openai_output_modalities = ["audio", "text"]
-                    _dbg(f"OPENAI_MODALITIES_FORCED output_modalities={openai_output_modalities} msg={msg!r}")
+                    _dbg(
+                        "OPENAI_MODALITIES_FORCED output_modalities=%s msg=%r",
+                        openai_output_modalities,
+                        msg,
+                    )
 
                 # Expected sometimes when fallback commit races with server-side auto-commit.
                 if code == "input_audio_buffer_commit_empty":
                     continue
 
                 if code != "response_cancel_not_active":
-                    _dbg(f"OPENAI_ERROR evt={evt!r}")
+                    _dbg("OPENAI_ERROR evt=%r", evt)
                 continue
 
             if etype == "input_audio_buffer.speech_started":
-                now = time.monotonic()
-                debounce_s = _speech_started_debounce_s()
+                now = monotonic()
+                debounce_s = cfg.speech_started_debounce_s
                 if (
-                    isinstance(last_speech_started_ts, float)
+                    last_speech_started_ts is not None
                     and debounce_s > 0.0
                     and (now - last_speech_started_ts) < debounce_s
                 ):
                     _dbg(
-                        "OPENAI_SPEECH_STARTED_DEBOUNCED "
-                        f"dt_ms={int((now - last_speech_started_ts) * 1000.0)}"
+                        "OPENAI_SPEECH_STARTED_DEBOUNCED dt_ms=%s",
+                        int((now - last_speech_started_ts) * 1000.0),
                     )
                     continue
                 last_speech_started_ts = now
@@ -1579,29 +2166,25 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 pending_speech_started_media_frames = twilio_media_frames_rx
                 pending_input_commit_sent = False
                 turn_seq += 1
-                turn_logged_speech_started = False
-                turn_logged_transcript = False
-                turn_logged_response_create = False
+                response_state.turn_log = TurnLog()
 
                 _dbg("OpenAI VAD: user speech START")
                 had_buffered_audio = bool(buffers.main) or bool(buffers.aux) or bool(buffers.remainder)
                 if active_response_id:
                     can_barge = _barge_in_allowed(
                         active_response_id=active_response_id,
-                        response_started_at=response_started_at,
                         response_state=response_state,
                         now_monotonic=now,
-                        min_response_ms=_barge_in_min_response_ms(),
-                        min_frames=_barge_in_min_frames(),
+                        min_response_ms=cfg.barge_in_min_response_ms,
+                        min_frames=cfg.barge_in_min_frames,
                     )
                     if can_barge:
                         dropped_bytes = _flush_output_audio_buffers(buffers)
                         wait_ctl.on_user_speech_started(buffers=buffers)
 
-                        sid = stream_sid_ref.get("streamSid")
-                        if sid:
-                            async with send_lock:
-                                await websocket.send_text(json.dumps(_build_twilio_clear_msg(sid)))
+                        clear_text = stream_sid_ref.get("clearText")
+                        if clear_text:
+                            await twilio_out_q.put(clear_text)
                             _dbg("TWILIO_CLEAR_SENT")
                         _dbg(
                             "BARGE-IN: user speech started while AI speaking; "
@@ -1609,75 +2192,64 @@ async def twilio_stream(websocket: WebSocket) -> None:
                         )
                         if dropped_bytes > 0:
                             _dbg(
-                                f"AUDIO_BUFFER_FLUSH_ON_SPEECH_STARTED dropped_bytes={dropped_bytes} "
-                                f"active_response_id={active_response_id}"
+                                "AUDIO_BUFFER_FLUSH_ON_SPEECH_STARTED dropped_bytes=%s "
+                                "active_response_id=%s",
+                                dropped_bytes,
+                                active_response_id,
                             )
-                        await openai_ws.send(json.dumps({"type": "response.cancel"}))
-                        if _barge_in_context_note_enabled():
+                        await openai_ws.send(OPENAI_RESPONSE_CANCEL_TEXT)
+                        if barge_in_note_text is not None:
                             try:
-                                await openai_ws.send(
-                                    json.dumps(
-                                        {
-                                            "type": "conversation.item.create",
-                                            "item": {
-                                                "type": "message",
-                                                "role": "system",
-                                                "content": [
-                                                    {
-                                                        "type": "input_text",
-                                                        "text": _barge_in_context_note_text(),
-                                                    }
-                                                ],
-                                            },
-                                        }
-                                    )
-                                )
+                                await openai_ws.send(barge_in_note_text)
                             except Exception as e:
-                                _dbg(f"BARGE_IN_CONTEXT_NOTE_FAILED err={e!r}")
+                                _dbg("BARGE_IN_CONTEXT_NOTE_FAILED err=%r", e)
                     else:
                         _dbg(
-                            "BARGE-IN_IGNORED_EARLY "
-                            f"response_id={active_response_id} "
-                            f"min_ms={_barge_in_min_response_ms()} min_frames={_barge_in_min_frames()}"
+                            "BARGE-IN_IGNORED_EARLY response_id=%s min_ms=%s min_frames=%s",
+                            active_response_id,
+                            cfg.barge_in_min_response_ms,
+                            cfg.barge_in_min_frames,
                         )
                 elif had_buffered_audio:
                     dropped_bytes = _flush_output_audio_buffers(buffers)
                     wait_ctl.on_user_speech_started(buffers=buffers)
-                    sid = stream_sid_ref.get("streamSid")
-                    if sid:
-                        async with send_lock:
-                            await websocket.send_text(json.dumps(_build_twilio_clear_msg(sid)))
+                    clear_text = stream_sid_ref.get("clearText")
+                    if clear_text:
+                        await twilio_out_q.put(clear_text)
                         _dbg("TWILIO_CLEAR_SENT")
                     _dbg(
                         "AUDIO_BUFFER_FLUSH_ON_SPEECH_STARTED "
-                        f"dropped_bytes={dropped_bytes} active_response_id=None"
+                        "dropped_bytes=%s active_response_id=None",
+                        dropped_bytes,
                     )
 
-                if not turn_logged_speech_started:
-                    _dbg(f"OPENAI_SPEECH_STARTED turn={turn_seq}")
-                    turn_logged_speech_started = True
+                if not response_state.turn_log.speech_started:
+                    _dbg("OPENAI_SPEECH_STARTED turn=%s", turn_seq)
+                    response_state.turn_log.speech_started = True
                 continue
 
             if etype == "input_audio_buffer.speech_stopped":
-                if _force_input_commit_enabled() and openai_ws is not None:
+                if cfg.force_input_commit_enabled and openai_ws is not None:
                     if pending_input_commit_sent:
                         _dbg("OPENAI_INPUT_COMMIT_SKIPPED reason=speech_stopped already_committed=1")
                         continue
-                    min_frames = _force_input_commit_min_frames()
+                    min_frames = cfg.force_input_commit_min_frames
                     start_frames = pending_speech_started_media_frames or twilio_media_frames_rx
                     captured_frames = max(0, twilio_media_frames_rx - start_frames)
                     if captured_frames < min_frames:
                         _dbg(
                             "OPENAI_INPUT_COMMIT_SKIPPED reason=speech_stopped "
-                            f"captured_frames={captured_frames} min_frames={min_frames}"
+                            "captured_frames=%s min_frames=%s",
+                            captured_frames,
+                            min_frames,
                         )
                         continue
                     try:
-                        await openai_ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
+                        await openai_ws.send(OPENAI_INPUT_COMMIT_TEXT)
                         pending_input_commit_sent = True
                         _dbg("OPENAI_INPUT_COMMIT_SENT reason=speech_stopped")
                     except Exception as e:
-                        _dbg(f"OPENAI_INPUT_COMMIT_FAILED reason=speech_stopped err={e!r}")
+                        _dbg("OPENAI_INPUT_COMMIT_FAILED reason=speech_stopped err=%r", e)
                 continue
 
             if etype == "conversation.item.input_audio_transcription.completed":
@@ -1685,15 +2257,14 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 if not transcript:
                     continue
 
-                if not turn_logged_transcript:
-                    _dbg(f"OPENAI_TRANSCRIPT completed len={len(transcript)} turn={turn_seq}")
-                    turn_logged_transcript = True
+                if not response_state.turn_log.transcript:
+                    _dbg("OPENAI_TRANSCRIPT completed len=%s turn=%s", len(transcript), turn_seq)
+                    response_state.turn_log.transcript = True
                 pending_speech_started_at = None
                 pending_speech_started_media_frames = None
                 pending_input_commit_sent = False
 
-                await _emit_flow_a_event(
-                    enabled=event_emit_enabled,
+                flow_a_events.emit(
                     tenant_id=call_tenant_id,
                     rid=call_rid,
                     event_type="flow_a.transcript_completed",
@@ -1709,7 +2280,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 )
                 heuristic_intents = _detect_transcript_intents(transcript)
                 nlu_intents: dict[str, dict[str, Any]] | None = None
-                if _intent_nlu_enabled():
+                if cfg.intent_nlu_enabled:
                     nlu_intents = await _classify_transcript_intents_nlu(transcript)
                 intents, shadow_compare = _resolve_intent_decisions(
                     heuristic_intents=heuristic_intents,
@@ -1718,12 +2289,11 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 sanitized = _sanitize_transcript_for_event(transcript)
                 if isinstance(shadow_compare, dict):
                     _dbg(
-                        "INTENT_SHADOW_COMPARE "
-                        f"heuristic={shadow_compare.get('heuristic')} "
-                        f"nlu={shadow_compare.get('nlu')}"
+                        "INTENT_SHADOW_COMPARE heuristic=%s nlu=%s",
+                        shadow_compare.get("heuristic"),
+                        shadow_compare.get("nlu"),
                     )
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.intent_shadow_compare",
@@ -1741,8 +2311,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
 
                 if bool((intents.get("callback") or {}).get("detected")) and "callback" not in emitted_intent_event_keys:
                     emitted_intent_event_keys.add("callback")
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.intent_callback",
@@ -1764,8 +2333,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     and "appointment" not in emitted_intent_event_keys
                 ):
                     emitted_intent_event_keys.add("appointment")
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.intent_appointment",
@@ -1786,8 +2354,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     and "talk_to_owner" not in emitted_intent_event_keys
                 ):
                     emitted_intent_event_keys.add("talk_to_owner")
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.intent_talk_to_owner",
@@ -1805,12 +2372,11 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     )
                 if (
                     bool((intents.get("callback") or {}).get("detected"))
-                    and _customer_sms_followup_enabled()
+                    and cfg.customer_sms_followup_enabled
                     and "sms_followup_requested" not in emitted_intent_event_keys
                 ):
                     emitted_intent_event_keys.add("sms_followup_requested")
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.sms_followup_requested",
@@ -1833,8 +2399,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                         intake_key = f"goal_intake:{goal_text or 'unknown'}"
                         if intake_key not in emitted_owner_goal_event_keys:
                             emitted_owner_goal_event_keys.add(intake_key)
-                            await _emit_flow_a_event(
-                                enabled=event_emit_enabled,
+                            flow_a_events.emit(
                                 tenant_id=call_tenant_id,
                                 rid=call_rid,
                                 event_type="flow_a.owner_goal_intake_requested",
@@ -1853,8 +2418,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                             )
                     if bool(owner_actions.get("goal_list")) and "goal_list" not in emitted_owner_goal_event_keys:
                         emitted_owner_goal_event_keys.add("goal_list")
-                        await _emit_flow_a_event(
-                            enabled=event_emit_enabled,
+                        flow_a_events.emit(
                             tenant_id=call_tenant_id,
                             rid=call_rid,
                             event_type="flow_a.owner_goal_list_requested",
@@ -1873,8 +2437,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                         pause_key = f"goal_pause:{goal_ref or 'unknown'}"
                         if pause_key not in emitted_owner_goal_event_keys:
                             emitted_owner_goal_event_keys.add(pause_key)
-                            await _emit_flow_a_event(
-                                enabled=event_emit_enabled,
+                            flow_a_events.emit(
                                 tenant_id=call_tenant_id,
                                 rid=call_rid,
                                 event_type="flow_a.owner_goal_pause_requested",
@@ -1895,8 +2458,7 @@ async def twilio_stream(websocket: WebSocket) -> None:
                         resume_key = f"goal_resume:{goal_ref or 'unknown'}"
                         if resume_key not in emitted_owner_goal_event_keys:
                             emitted_owner_goal_event_keys.add(resume_key)
-                            await _emit_flow_a_event(
-                                enabled=event_emit_enabled,
+                            flow_a_events.emit(
                                 tenant_id=call_tenant_id,
                                 rid=call_rid,
                                 event_type="flow_a.owner_goal_resume_requested",
@@ -1917,197 +2479,122 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     continue
 
                 # Keep output audio enabled deterministically.
-                modalities = ["audio", "text"]
-                await openai_ws.send(json.dumps({"type": "response.create", "response": {"modalities": modalities}}))
+                await openai_ws.send(OPENAI_RESPONSE_CREATE_TEXT)
 
-                if not turn_logged_response_create:
-                    _dbg(f"OPENAI_RESPONSE_CREATE_SENT rid={turn_seq} modalities={modalities!r}")
-                    turn_logged_response_create = True
+                if not response_state.turn_log.response_create:
+                    _dbg(
+                        "OPENAI_RESPONSE_CREATE_SENT rid=%s modalities=['audio', 'text']",
+                        turn_seq,
+                    )
+                    response_state.turn_log.response_create = True
                 continue
 
             if etype == "response.created":
-                response = evt.get("response") if isinstance(evt.get("response"), dict) else {}
+                response_raw = evt.get("response")
+                response = response_raw if isinstance(response_raw, dict) else {}
                 rid = response.get("id")
                 if isinstance(rid, str) and rid:
-                    if _flush_on_response_created_enabled():
+                    if cfg.flush_on_response_created:
                         dropped_bytes = _flush_output_audio_buffers(buffers)
                         if dropped_bytes > 0:
-                            sid = stream_sid_ref.get("streamSid")
-                            if sid:
-                                async with send_lock:
-                                    await websocket.send_text(json.dumps(_build_twilio_clear_msg(sid)))
+                            clear_text = stream_sid_ref.get("clearText")
+                            if clear_text:
+                                await twilio_out_q.put(clear_text)
                                 _dbg("TWILIO_CLEAR_SENT")
                             _dbg(
-                                f"AUDIO_BUFFER_FLUSH_ON_RESPONSE_CREATED response_id={rid} "
-                                f"dropped_bytes={dropped_bytes}"
+                                "AUDIO_BUFFER_FLUSH_ON_RESPONSE_CREATED response_id=%s "
+                                "dropped_bytes=%s",
+                                rid,
+                                dropped_bytes,
                             )
                     active_response_id = rid
-                    response_state["active_response_id"] = rid
-                    response_started_at[rid] = time.monotonic()
-                    _dbg(f"OPENAI_RESPONSE_CREATED id={rid}")
+                    response_state.active_response_id = rid
+                    response_state.started_at_by_id[rid] = monotonic()
+                    jitter.on_response_start()
+                    _dbg("OPENAI_RESPONSE_CREATED id=%s", rid)
                 continue
 
             if etype == "response.output_text.delta":
-                delta = evt.get("delta")
-                evt_rid = evt.get("response_id")
-                rid = evt_rid if isinstance(evt_rid, str) and evt_rid else active_response_id
-                if isinstance(rid, str):
-                    logged_text_ids = response_state.get("logged_text_delta_ids")
-                    if isinstance(logged_text_ids, set) and rid not in logged_text_ids:
-                        _dbg(
-                            f"OPENAI_TEXT_DELTA_FIRST response_id={rid} "
-                            f"chars={(len(delta) if isinstance(delta, str) else 0)}"
-                        )
-                        logged_text_ids.add(rid)
+                turn_log = response_state.turn_log
+                if not turn_log.first_text:
+                    delta = evt.get("delta")
+                    evt_rid = evt.get("response_id")
+                    rid = evt_rid if isinstance(evt_rid, str) and evt_rid else active_response_id
+                    _dbg(
+                        "OPENAI_TEXT_DELTA_FIRST response_id=%s chars=%s",
+                        rid,
+                        len(delta) if isinstance(delta, str) else 0,
+                    )
+                    turn_log.first_text = True
                 continue
 
             # Some Realtime variants may stream audio via content-part events instead of output_audio.delta.
             # Treat these as a fallback path into the same Twilio "main lane" buffer.
             if etype in ("response.content_part.added", "response.content_part.done"):
-                part = evt.get("part") if isinstance(evt.get("part"), dict) else {}
+                part_raw = evt.get("part")
+                part = part_raw if isinstance(part_raw, dict) else {}
                 audio_b64 = part.get("audio")
                 if isinstance(audio_b64, str) and audio_b64:
-                    evt_rid = evt.get("response_id")
-                    response_id = evt_rid if isinstance(evt_rid, str) and evt_rid else None
-                    if not _should_accept_response_audio(
-                        response_id=response_id,
-                        active_response_id=active_response_id,
-                    ):
-                        _dbg(
-                            "OPENAI_AUDIO_DROPPED "
-                            f"response_id={response_id} active_response_id={active_response_id}"
-                        )
-                        continue
-                    try:
-                        chunk = base64.b64decode(audio_b64)
-                    except Exception:
-                        continue
-
-                    frames = _chunk_to_frames(buffers.remainder, chunk)
-                    for f in frames:
-                        if len(buffers.main) >= buffers.main_max_frames:
-                            buffers.main.popleft()
-                        buffers.main.append(f)
-
-                    rid = evt_rid if isinstance(evt_rid, str) and evt_rid else active_response_id
-                    if isinstance(rid, str):
-                        diag = response_audio_diag.setdefault(rid, _diag_init())
-                        diag["delta_chunks"] += 1
-                        prev = response_last_frame.get(rid)
-                        for f in frames:
-                            _diag_update_frame(diag, f, prev)
-                            prev = f
-                        if prev is not None:
-                            response_last_frame[rid] = prev
-
-                        seen_audio_ids = response_state.get("seen_audio_ids")
-                        if isinstance(seen_audio_ids, set):
-                            seen_audio_ids.add(rid)
-
-                        logged_delta_ids = response_state.get("logged_delta_ids")
-                        if isinstance(logged_delta_ids, set) and rid not in logged_delta_ids:
-                            _dbg(
-                                f"OPENAI_AUDIO_PART_FIRST response_id={rid} "
-                                f"bytes={len(chunk)} part_type={part.get('type')}"
-                            )
-                            logged_delta_ids.add(rid)
-                continue
-
-            if etype in ("response.output_audio.delta", "response.audio.delta"):
-                delta_b64 = evt.get("delta")
-                if not isinstance(delta_b64, str) or not delta_b64:
-                    continue
-                evt_rid = evt.get("response_id")
-                response_id = evt_rid if isinstance(evt_rid, str) and evt_rid else None
-                if not _should_accept_response_audio(
-                    response_id=response_id,
-                    active_response_id=active_response_id,
-                ):
-                    _dbg(
-                        "OPENAI_AUDIO_DROPPED "
-                        f"response_id={response_id} active_response_id={active_response_id}"
+                    _ingest_response_audio(
+                        audio_b64,
+                        evt.get("response_id"),
+                        first_label="OPENAI_AUDIO_PART_FIRST",
+                        first_extra=f" part_type={part.get('type')}",
                     )
-                    continue
-                try:
-                    chunk = base64.b64decode(delta_b64)
-                except Exception:
-                    continue
-
-                frames = _chunk_to_frames(buffers.remainder, chunk)
-                for f in frames:
-                    if len(buffers.main) >= buffers.main_max_frames:
-                        buffers.main.popleft()
-                    buffers.main.append(f)
-
-                rid = evt_rid if isinstance(evt_rid, str) and evt_rid else active_response_id
-                if isinstance(rid, str):
-                    diag = response_audio_diag.setdefault(rid, _diag_init())
-                    diag["delta_chunks"] += 1
-                    prev = response_last_frame.get(rid)
-                    for f in frames:
-                        _diag_update_frame(diag, f, prev)
-                        prev = f
-                    if prev is not None:
-                        response_last_frame[rid] = prev
-
-                    seen_audio_ids = response_state.get("seen_audio_ids")
-                    if isinstance(seen_audio_ids, set):
-                        seen_audio_ids.add(rid)
-
-                    logged_delta_ids = response_state.get("logged_delta_ids")
-                    if isinstance(logged_delta_ids, set) and rid not in logged_delta_ids:
-                        _dbg(f"OPENAI_AUDIO_DELTA_FIRST response_id={rid} bytes={len(chunk)}")
-                        logged_delta_ids.add(rid)
                 continue
 
             if etype == "response.done":
-                response = evt.get("response") if isinstance(evt.get("response"), dict) else {}
+                response_raw = evt.get("response")
+                response = response_raw if isinstance(response_raw, dict) else {}
                 rid = response.get("id")
                 out_mods = response.get("output_modalities")
-                if isinstance(rid, str):
-                    processed_done_ids = response_state.get("processed_response_done_ids")
-                    if isinstance(processed_done_ids, set) and rid in processed_done_ids:
-                        _dbg(f"OPENAI_RESPONSE_DONE_DUPLICATE id={rid}")
+                # Check the id's type once; every per-id map below is keyed by non-empty str ids.
+                has_rid = isinstance(rid, str) and bool(rid)
+                had_audio = False
+                if has_rid:
+                    processed_done_ids = response_state.processed_response_done_ids
+                    if rid in processed_done_ids:
+                        _dbg("OPENAI_RESPONSE_DONE_DUPLICATE id=%s", rid)
                         continue
-                    if isinstance(processed_done_ids, set):
-                        processed_done_ids.add(rid)
-                _dbg(f"OPENAI_RESPONSE_DONE id={rid} output_modalities={out_mods}")
-                if isinstance(rid, str):
-                    started = response_started_at.get(rid)
-                    if isinstance(started, float):
-                        dt_ms = int((time.monotonic() - started) * 1000.0)
-                        _dbg(f"speech_ctrl_ACTIVE_DONE type=response.done response_id={rid} dt_ms={dt_ms}")
+                    processed_done_ids.add(rid)
+                _dbg("OPENAI_RESPONSE_DONE id=%s output_modalities=%s", rid, out_mods)
+                if has_rid:
+                    started = response_state.started_at_by_id.get(rid)
+                    if started is not None:
+                        dt_ms = int((monotonic() - started) * 1000.0)
+                        _dbg(
+                            "speech_ctrl_ACTIVE_DONE type=response.done response_id=%s dt_ms=%s",
+                            rid,
+                            dt_ms,
+                        )
                     diag = response_audio_diag.get(rid)
-                    if isinstance(diag, dict):
+                    if diag is not None:
                         score = _diag_score(diag)
-                        frames = max(1, int(diag.get("frames", 0)))
-                        same_ratio = float(diag.get("same_as_prev_frames", 0)) / float(frames)
-                        low_div_ratio = float(diag.get("low_diversity_frames", 0)) / float(frames)
-                        silence_ratio = float(diag.get("silence_like_frames", 0)) / float(frames)
+                        same_ratio, low_div_ratio, silence_ratio = _diag_ratios(diag)
                         _dbg(
-                            "AUDIO_HEALTH "
-                            f"response_id={rid} score={score} frames={diag.get('frames',0)} "
-                            f"chunks={diag.get('delta_chunks',0)} bytes={diag.get('bytes',0)} "
-                            f"same_ratio={same_ratio:.2f} same_run_max={diag.get('same_run_max',0)} "
-                            f"low_div_ratio={low_div_ratio:.2f} silence_ratio={silence_ratio:.2f}"
+                            "AUDIO_HEALTH response_id=%s score=%s frames=%s chunks=%s bytes=%s "
+                            "same_ratio=%.2f same_run_max=%s low_div_ratio=%.2f silence_ratio=%.2f",
+                            rid,
+                            score,
+                            diag.frames,
+                            diag.delta_chunks,
+                            diag.bytes,
+                            same_ratio,
+                            diag.same_run_max,
+                            low_div_ratio,
+                            silence_ratio,
+                        )
+                    done_no_audio_ids = response_state.logged_done_no_audio_ids
+                    had_audio = rid in response_state.seen_audio_ids
+                    if not had_audio and rid not in done_no_audio_ids:
+                        _dbg(
+                            "OPENAI_RESPONSE_DONE_NO_AUDIO id=%s output_modalities=%s",
+                            rid,
+                            out_mods,
                         )
-                had_audio = False
-
-                if isinstance(rid, str) and rid:
-                    seen_audio_ids = response_state.get("seen_audio_ids")
-                    done_no_audio_ids = response_state.get("logged_done_no_audio_ids")
-                    had_audio = isinstance(seen_audio_ids, set) and rid in seen_audio_ids
-                    if (
-                        isinstance(seen_audio_ids, set)
-                        and isinstance(done_no_audio_ids, set)
-                        and rid not in seen_audio_ids
-                        and rid not in done_no_audio_ids
-                    ):
-                        _dbg(f"OPENAI_RESPONSE_DONE_NO_AUDIO id={rid} output_modalities={out_mods}")
                         done_no_audio_ids.add(rid)
 
-                await _emit_flow_a_event(
-                    enabled=event_emit_enabled,
+                flow_a_events.emit(
                     tenant_id=call_tenant_id,
                     rid=call_rid,
                     event_type="flow_a.response_done",
@@ -2123,32 +2610,29 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     },
                 )
 
-                if isinstance(rid, str) and rid and rid == active_response_id:
+                if has_rid:
+                    # Drop per-response state for any finished rid, including one a newer
+                    # response.created already superseded; otherwise those entries live for the call.
+                    response_state.started_at_by_id.pop(rid, None)
+                    response_audio_diag.pop(rid, None)
+                    response_last_frame.pop(rid, None)
+                    response_state.sent_main_frames_by_id.pop(rid, None)
+                    response_state.playout_started_ids.discard(rid)
+                    response_state.refill_wait_started_by_id.pop(rid, None)
+                if has_rid and rid == active_response_id:
                     _dbg(
-                        f"Response {rid} finished with event 'response.done'; "
-                        "clearing active_response_id"
+                        "Response %s finished with event 'response.done'; "
+                        "clearing active_response_id",
+                        rid,
                     )
                     active_response_id = None
-                    response_state["active_response_id"] = None
-                    response_started_at.pop(rid, None)
-                    response_audio_diag.pop(rid, None)
-                    response_last_frame.pop(rid, None)
-                    sent_map = response_state.get("sent_main_frames_by_id")
-                    if isinstance(sent_map, dict):
-                        sent_map.pop(rid, None)
-                    playout_started_ids = response_state.get("playout_started_ids")
-                    if isinstance(playout_started_ids, set):
-                        playout_started_ids.discard(rid)
-                    refill_wait_started_by_id = response_state.get("refill_wait_started_by_id")
-                    if isinstance(refill_wait_started_by_id, dict):
-                        refill_wait_started_by_id.pop(rid, None)
-                    if len(buffers.remainder) < FRAME_BYTES:
-                        buffers.remainder.clear()
+                    response_state.active_response_id = None
+                    # All deltas precede response.done: play the < FRAME_BYTES tail rather than drop it.
+                    _pad_out_partial_frame(buffers)
                 if rid is None:
                     active_response_id = None
-                    response_state["active_response_id"] = None
-                    if len(buffers.remainder) < FRAME_BYTES:
-                        buffers.remainder.clear()
+                    response_state.active_response_id = None
+                    buffers.remainder.clear()
                 continue
 
     async def _send_openai_session_update() -> None:
@@ -2163,125 +2647,166 @@ async def twilio_stream(websocket: WebSocket) -> None:
             return
         prompt = _initial_greeting_text()
         try:
-            await openai_ws.send(
-                json.dumps(
-                    {
-                        "type": "conversation.item.create",
-                        "item": {
-                            "type": "message",
-                            "role": "user",
-                            "content": [{"type": "input_text", "text": prompt}],
-                        },
-                    }
-                )
-            )
-            await openai_ws.send(
-                json.dumps({"type": "response.create", "response": {"modalities": ["audio", "text"]}})
-            )
+            await openai_ws.send(_openai_message_item_text("user", prompt))
+            await openai_ws.send(OPENAI_RESPONSE_CREATE_TEXT)
             _dbg("OPENAI_INITIAL_GREETING_SENT")
         except Exception as e:
-            _dbg(f"OPENAI_INITIAL_GREETING_FAILED err={e!r}")
+            _dbg("OPENAI_INITIAL_GREETING_FAILED err=%r", e)
+
+    def _emit_call_stopped(reason: str) -> None:
+        # Stop, disconnect and cleanup all funnel here; only the first one emits.
+        nonlocal call_stopped_emitted
+        if call_stopped_emitted:
+            return
+        call_stopped_emitted = True
+        flow_a_events.emit(
+            tenant_id=call_tenant_id,
+            rid=call_rid,
+            event_type="flow_a.call_stopped",
+            payload=_lifecycle_event_payload(
+                tenant_id=call_tenant_id,
+                rid=call_rid,
+                ai_mode=call_ai_mode,
+                tenant_mode=call_tenant_mode,
+                call_sid=call_sid,
+                stream_sid=call_stream_sid,
+                from_number=call_from_number,
+                to_number=call_to_number,
+                reason=reason,
+            ),
+            idempotency_key=call_stopped_idem_key,
+        )
 
     async def _speech_ctrl_heartbeat_loop() -> None:
         nonlocal logged_media_absent, pending_input_commit_sent, pending_speech_started_at
         nonlocal pending_speech_started_media_frames
-        every_s = max(0.5, _env_int("VOICE_SPEECH_CTRL_HEARTBEAT_MS", 2000) / 1000.0)
-        heartbeat_log_enabled = _speech_ctrl_heartbeat_log_enabled()
+        every_s = cfg.speech_ctrl_heartbeat_s
+        heartbeat_log_enabled = cfg.speech_ctrl_heartbeat_log_enabled
+        force_commit_enabled = cfg.force_input_commit_enabled
+        force_commit_after_s = cfg.force_input_commit_after_s
         while True:
             await asyncio.sleep(every_s)
             now = time.monotonic()
             media_idle_ms = int((now - (last_media_rx_ts or ws_started_at)) * 1000.0)
             if heartbeat_log_enabled:
                 _dbg(
-                    "speech_ctrl_HEARTBEAT "
-                    f"enabled={bridge_enabled} shadow=False qsize={in_q.qsize()} "
-                    f"active_response_id={response_state.get('active_response_id')} "
-                    f"media_rx_frames={twilio_media_frames_rx} media_idle_ms={media_idle_ms}"
+                    "speech_ctrl_HEARTBEAT enabled=%s shadow=False qsize=%d in_overwrites=%d "
+                    "in_decode_drops=%d event_drops=%d active_response_id=%s media_rx_frames=%d "
+                    "media_idle_ms=%d",
+                    bridge_enabled,
+                    len(in_q),
+                    in_q.overwrites,
+                    in_q.decode_drops,
+                    flow_a_events.dropped,
+                    response_state.active_response_id,
+                    twilio_media_frames_rx,
+                    media_idle_ms,
                 )
             if not logged_media_absent and twilio_media_frames_rx == 0 and (now - ws_started_at) >= 5.0:
                 _dbg("TWILIO_MEDIA_NOT_RECEIVED_AFTER_5S")
                 logged_media_absent = True
             if (
-                _force_input_commit_enabled()
+                force_commit_enabled
                 and bridge_enabled
                 and openai_ws is not None
                 and pending_speech_started_at is not None
                 and not pending_input_commit_sent
                 and active_response_id is None
-                and (now - pending_speech_started_at) >= _force_input_commit_after_s()
+                and (now - pending_speech_started_at) >= force_commit_after_s
             ):
-                min_frames = _force_input_commit_min_frames()
+                min_frames = cfg.force_input_commit_min_frames
                 start_frames = pending_speech_started_media_frames or twilio_media_frames_rx
                 captured_frames = max(0, twilio_media_frames_rx - start_frames)
                 if captured_frames < min_frames:
                     _dbg(
                         "OPENAI_INPUT_COMMIT_SKIPPED reason=heartbeat_fallback "
-                        f"captured_frames={captured_frames} min_frames={min_frames}"
+                        "captured_frames=%s min_frames=%s",
+                        captured_frames,
+                        min_frames,
                     )
                     continue
                 try:
-                    await openai_ws.send(json.dumps({"type": "input_audio_buffer.commit"}))
+                    await openai_ws.send(OPENAI_INPUT_COMMIT_TEXT)
                     pending_input_commit_sent = True
                     _dbg(
-                        "OPENAI_INPUT_COMMIT_SENT "
-                        f"reason=heartbeat_fallback dt_ms={int((now - pending_speech_started_at) * 1000.0)}"
+                        "OPENAI_INPUT_COMMIT_SENT reason=heartbeat_fallback dt_ms=%s",
+                        int((now - pending_speech_started_at) * 1000.0),
                     )
                 except Exception as e:
-                    _dbg(f"OPENAI_INPUT_COMMIT_FAILED reason=heartbeat_fallback err={e!r}")
+                    _dbg("OPENAI_INPUT_COMMIT_FAILED reason=heartbeat_fallback err=%r", e)
 
     try:
+        writer_task = asyncio.create_task(_twilio_writer_loop(websocket=websocket, out_q=twilio_out_q))
+        call_task = asyncio.current_task()
+        if call_task is not None:
+            # A dead writer leaves producers blocked on the full out queue; end the call instead.
+            writer_task.add_done_callback(_cancel_on_failure(call_task))
         sender_task = asyncio.create_task(
             _twilio_sender_loop(
-                websocket=websocket,
-                send_lock=send_lock,
+                out_q=twilio_out_q,
                 stream_sid_ref=stream_sid_ref,
                 buffers=buffers,
                 wait_ctl=wait_ctl,
                 response_state=response_state,
+                cfg=cfg,
+                jitter=jitter,
             )
         )
         heartbeat_task = asyncio.create_task(_speech_ctrl_heartbeat_loop())
+        if flow_a_events.enabled:
+            # DB writes leave the audio loops: emit() only queues, this task awaits the thread hop.
+            events_task = asyncio.create_task(flow_a_events.run())
 
+        # One clock read per media frame (heartbeat idle diag); bind it like the OpenAI reader does.
+        monotonic = time.monotonic
         while True:
             raw = await websocket.receive_text()
+            # Media is ~50 frames/s per call: take the payload without building the event dict.
+            fast_payload = _twilio_media_payload(raw)
+            if fast_payload is not None:
+                if fast_payload and bridge_enabled and openai_ws is not None:
+                    twilio_media_frames_rx += 1
+                    last_media_rx_ts = monotonic()
+                    in_q.put(fast_payload)
+                continue
             evt = json.loads(raw)
             event_type = evt.get("event")
 
+            # Media the fast path declined (unexpected layout/escapes); still before start/stop.
+            if event_type == "media":
+                if bridge_enabled and openai_ws is not None:
+                    payload = (evt.get("media") or {}).get("payload")
+                    if isinstance(payload, str) and payload:
+                        twilio_media_frames_rx += 1
+                        last_media_rx_ts = monotonic()
+                        in_q.put(payload)
+                continue
+
             if event_type == "start":
-                start = evt.get("start") or {}
-                stream_sid_ref["streamSid"] = start.get("streamSid")
-                call_sid = start.get("callSid")
-                custom_raw = start.get("customParameters")
-                custom = custom_raw if isinstance(custom_raw, dict) else {}
-
-                rid = custom.get("rid") or call_sid
-                tenant_id_raw = custom.get("tenant_id")
-                tenant_id = tenant_id_raw if isinstance(tenant_id_raw, str) and tenant_id_raw.strip() else None
-                tenant_mode = custom.get("tenant_mode")
-                from_number = custom.get("from_number")
-                to_number = custom.get("to_number")
-                ai_mode_raw = custom.get("ai_mode")
-                ai_mode = _normalize_ai_mode(ai_mode_raw if isinstance(ai_mode_raw, str) else None)
-                call_tenant_id = tenant_id
-                call_tenant_mode = tenant_mode if isinstance(tenant_mode, str) else None
-                call_ai_mode = ai_mode
-                call_rid = rid if isinstance(rid, str) else None
-                call_sid = call_sid if isinstance(call_sid, str) else None
-                call_stream_sid = stream_sid_ref.get("streamSid")
-                call_from_number = from_number if isinstance(from_number, str) else None
-                call_to_number = to_number if isinstance(to_number, str) else None
+                start_info = _parse_twilio_start(evt)
+                call_sid = start_info.call_sid
+                call_stream_sid = start_info.stream_sid
+                call_rid = start_info.rid
+                call_tenant_id = start_info.tenant_id
+                call_tenant_mode = start_info.tenant_mode
+                call_ai_mode = start_info.ai_mode
+                call_from_number = start_info.from_number
+                call_to_number = start_info.to_number
+                call_stopped_idem_key = f"{call_rid}:call_stopped" if call_rid else None
+                stream_sid_ref["streamSid"] = call_stream_sid
+                stream_sid_ref["clearText"] = _twilio_clear_text(call_stream_sid) if call_stream_sid else None
                 # Keep compatibility with existing policy resolver that uses client|owner naming.
-                actor_mode = "owner" if ai_mode == "owner" else "client"
-                voice, instructions = _resolve_actor_mode_policy(tenant_id, actor_mode)
-                mode_instructions = _resolve_mode_instructions(ai_mode)
-                knowledge_context = _resolve_customer_knowledge_context(custom_parameters=custom)
-                if ai_mode == "customer":
+                actor_mode = "owner" if call_ai_mode == "owner" else "client"
+                voice, instructions = _resolve_actor_mode_policy(call_tenant_id, actor_mode)
+                mode_instructions = _resolve_mode_instructions(call_ai_mode)
+                knowledge_context = _resolve_customer_knowledge_context(custom_parameters=start_info.custom)
+                if call_ai_mode == "customer":
                     instructions = _build_customer_instructions(
                         base_instructions=instructions,
                         mode_instructions=mode_instructions,
                         knowledge_context=knowledge_context,
                     )
-                elif ai_mode == "owner":
+                elif call_ai_mode == "owner":
                     instructions = _build_owner_instructions(
                         base_instructions=instructions,
                         mode_instructions=mode_instructions,
@@ -2290,26 +2815,41 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     instructions = mode_instructions
 
                 _dbg(
-                    f"TWILIO_WS_START streamSid={stream_sid_ref['streamSid']} callSid={call_sid} "
-                    f"from={from_number} tenant={tenant_id} tenant_mode={tenant_mode} rid={rid} ai_mode={ai_mode}"
+                    "TWILIO_WS_START streamSid=%s callSid=%s "
+                    "from=%s tenant=%s tenant_mode=%s rid=%s ai_mode=%s",
+                    call_stream_sid,
+                    call_sid,
+                    call_from_number,
+                    call_tenant_id,
+                    call_tenant_mode,
+                    call_rid,
+                    call_ai_mode,
                 )
                 _dbg(
-                    f"VOICE_FLOW_A_START tenant_id={tenant_id} tenant_mode={tenant_mode} "
-                    f"rid={rid} ai_mode={ai_mode}"
+                    "VOICE_FLOW_A_START tenant_id=%s tenant_mode=%s rid=%s ai_mode=%s",
+                    call_tenant_id,
+                    call_tenant_mode,
+                    call_rid,
+                    call_ai_mode,
                 )
                 if not logged_mode_selection:
-                    _dbg(f"VOICE_FLOW_A_MODE_SELECTED ai_mode={ai_mode} tenant_id={tenant_id} rid={rid}")
+                    _dbg(
+                        "VOICE_FLOW_A_MODE_SELECTED ai_mode=%s tenant_id=%s rid=%s",
+                        call_ai_mode,
+                        call_tenant_id,
+                        call_rid,
+                    )
                     logged_mode_selection = True
-                if ai_mode == "customer":
+                if call_ai_mode == "customer":
                     _dbg(
-                        "FLOW_A_KNOWLEDGE_CONTEXT "
-                        f"template_key={knowledge_context.get('template_key')} "
-                        f"profile_version={knowledge_context.get('profile_version')} "
-                        f"profile_hash={knowledge_context.get('profile_hash')}"
+                        "FLOW_A_KNOWLEDGE_CONTEXT template_key=%s profile_version=%s "
+                        "profile_hash=%s",
+                        knowledge_context.get("template_key"),
+                        knowledge_context.get("profile_version"),
+                        knowledge_context.get("profile_hash"),
                     )
 
-                await _emit_flow_a_event(
-                    enabled=event_emit_enabled,
+                flow_a_events.emit(
                     tenant_id=call_tenant_id,
                     rid=call_rid,
                     event_type="flow_a.call_started",
@@ -2325,9 +2865,8 @@ async def twilio_stream(websocket: WebSocket) -> None:
                     ),
                     idempotency_key=f"{call_rid}:call_started" if call_rid else None,
                 )
-                if ai_mode == "customer":
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
+                if call_ai_mode == "customer":
+                    flow_a_events.emit(
                         tenant_id=call_tenant_id,
                         rid=call_rid,
                         event_type="flow_a.knowledge_context",
@@ -2353,90 +2892,39 @@ async def twilio_stream(websocket: WebSocket) -> None:
                         out_task = asyncio.create_task(_openai_to_twilio_loop())
                         await _maybe_send_initial_greeting()
                     except Exception as e:
-                        _dbg(f"OPENAI_CONNECT_FAILED err={e!r}")
+                        _dbg("OPENAI_CONNECT_FAILED err=%r", e)
 
                 continue
 
-            if event_type == "media":
-                if bridge_enabled and openai_ws is not None:
-                    payload = (evt.get("media") or {}).get("payload")
-                    if isinstance(payload, str) and payload:
-                        twilio_media_frames_rx += 1
-                        last_media_rx_ts = time.monotonic()
-                        _drop_oldest_put(payload)
-                continue
-
             if event_type == "stop":
                 stop = evt.get("stop") or {}
-                _dbg(f"TWILIO_WS_STOP streamSid={stream_sid_ref.get('streamSid')} callSid={stop.get('callSid')}")
-                if not call_stopped_emitted:
-                    await _emit_flow_a_event(
-                        enabled=event_emit_enabled,
-                        tenant_id=call_tenant_id,
-                        rid=call_rid,
-                        event_type="flow_a.call_stopped",
-                        payload=_lifecycle_event_payload(
-                            tenant_id=call_tenant_id,
-                            rid=call_rid,
-                            ai_mode=call_ai_mode,
-                            tenant_mode=call_tenant_mode,
-                            call_sid=call_sid,
-                            stream_sid=call_stream_sid,
-                            from_number=call_from_number,
-                            to_number=call_to_number,
-                            reason="twilio_stop",
-                        ),
-                        idempotency_key=f"{call_rid}:call_stopped" if call_rid else None,
-                    )
-                    call_stopped_emitted = True
+                _dbg(
+                    "TWILIO_WS_STOP streamSid=%s callSid=%s",
+                    stream_sid_ref.get("streamSid"),
+                    stop.get("callSid"),
+                )
+                _emit_call_stopped("twilio_stop")
                 break
 
     except WebSocketDisconnect:
-        if not call_stopped_emitted:
-            await _emit_flow_a_event(
-                enabled=event_emit_enabled,
-                tenant_id=call_tenant_id,
-                rid=call_rid,
-                event_type="flow_a.call_stopped",
-                payload=_lifecycle_event_payload(
-                    tenant_id=call_tenant_id,
-                    rid=call_rid,
-                    ai_mode=call_ai_mode,
-                    tenant_mode=call_tenant_mode,
-                    call_sid=call_sid,
-                    stream_sid=call_stream_sid,
-                    from_number=call_from_number,
-                    to_number=call_to_number,
-                    reason="twilio_disconnect",
-                ),
-                idempotency_key=f"{call_rid}:call_stopped" if call_rid else None,
-            )
-            call_stopped_emitted = True
+        _emit_call_stopped("twilio_disconnect")
+    except asyncio.CancelledError:
+        # Only the writer's done callback cancels the call from inside; any other cancel propagates.
+        if writer_task is None or not writer_task.done() or writer_task.cancelled() or writer_task.exception() is None:
+            raise
+        current = asyncio.current_task()
+        if current is not None:
+            current.uncancel()
+        _emit_call_stopped("twilio_writer_failed")
     except Exception as e:
-        _dbg(f"TWILIO_WS_ERROR err={e!r}")
+        _dbg("TWILIO_WS_ERROR err=%r", e)
     finally:
-        if not call_stopped_emitted:
-            await _emit_flow_a_event(
-                enabled=event_emit_enabled,
-                tenant_id=call_tenant_id,
-                rid=call_rid,
-                event_type="flow_a.call_stopped",
-                payload=_lifecycle_event_payload(
-                    tenant_id=call_tenant_id,
-                    rid=call_rid,
-                    ai_mode=call_ai_mode,
-                    tenant_mode=call_tenant_mode,
-                    call_sid=call_sid,
-                    stream_sid=call_stream_sid,
-                    from_number=call_from_number,
-                    to_number=call_to_number,
-                    reason="stream_cleanup",
-                ),
-                idempotency_key=f"{call_rid}:call_stopped" if call_rid else None,
-            )
-        for t in (in_task, out_task, sender_task, heartbeat_task):
-            if t:
-                t.cancel()
+        _emit_call_stopped("stream_cleanup")
+        call_tasks = [t for t in (in_task, out_task, sender_task, writer_task, heartbeat_task) if t is not None]
+        for t in call_tasks:
+            t.cancel()
+        # Let the cancellations land before closing sockets, so no loop outlives the call or hits a closed socket.
+        await asyncio.gather(*call_tasks, return_exceptions=True)
         try:
             if openai_ws is not None:
                 await openai_ws.close()
@@ -2447,6 +2935,11 @@ async def twilio_stream(websocket: WebSocket) -> None:
                 await websocket.close()
         except Exception:
             pass
+        # Sockets are closed first; then flush pending events (call_stopped included).
+        flow_a_events.close()
+        if events_task is not None:
+            with contextlib.suppress(Exception):
+                await events_task
 
 
 def selftests() -> dict[str, Any]:
@@ -1,35 +1,68 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import dataclasses
+import inspect
+import json
+import re
+import time
+import types
+
+from fastapi import WebSocketDisconnect
+from starlette.websockets import WebSocketState
 
 from core.app import create_app
 from features import voice_flow_a
 from features.voice_flow_a import (
+    OPENAI_HANDLED_EVENT_TYPES,
+    OPENAI_RESPONSE_CREATE_TEXT,
+    AudioDiag,
+    FlowAEventQueue,
+    InboundMediaRing,
+    JitterEstimator,
     OutgoingAudioBuffers,
+    ResponseState,
+    RidRing,
+    TurnLog,
     WaitingAudioController,
     _audio_queue_bytes,
     _barge_in_allowed,
     _build_customer_instructions,
     _build_owner_instructions,
     _build_openai_session_update,
+    _adaptive_playout_start_enabled,
     _build_twilio_clear_msg,
     _build_twilio_mark_msg,
+    _byte_diversity,
+    _cancel_on_failure,
     _chunk_to_frames,
+    _coalesce_b64_audio,
     _customer_sms_followup_enabled,
+    _dbg,
     _detect_transcript_intents,
     _detect_owner_goal_actions,
-    _diag_init,
     _diag_score,
     _diag_update_frame,
+    _diag_update_frames,
     _effective_prebuffer_frames,
     _force_input_commit_min_frames,
     _force_input_commit_after_s,
     _force_input_commit_enabled,
+    _load_flow_a_config,
     _flush_on_response_created_enabled,
     _flush_output_audio_buffers,
     _initial_greeting_enabled,
     _initial_greeting_text,
+    _openai_append_batch_frames,
+    _openai_append_linger_s,
     _is_sender_underrun_state,
+    _openai_append_text,
+    _openai_message_item_text,
+    _pad_out_partial_frame,
+    _openai_event_skippable,
+    _parse_twilio_start,
+    _twilio_media_payload,
     _lifecycle_event_payload,
     _playout_low_water_frames,
     _playout_refill_hold_s,
@@ -43,6 +76,11 @@ from features.voice_flow_a import (
     _twilio_chunk_frames,
     _twilio_chunk_mode_enabled,
     _twilio_mark_enabled,
+    _twilio_clear_text,
+    _twilio_mark_prefix,
+    _wait_for_main_audio,
+    _twilio_media_envelope,
+    _ws_recv_supports_raw,
 )
 
 
@@ -95,6 +133,509 @@ def test_chunk_to_frames_yields_160_byte_frames_with_remainder() -> None:
     assert len(remainder) == 0
 
 
+def test_chunk_to_frames_large_delta_preserves_order() -> None:
+    remainder = bytearray(b"r" * 100)
+    data = bytes(i % 251 for i in range(2000))
+    out = _chunk_to_frames(remainder, data, frame_bytes=160)
+    assert len(out) == 13
+    assert all(type(f) is bytes and len(f) == 160 for f in out)
+    assert b"".join(out) + bytes(remainder) == b"r" * 100 + data
+    assert len(remainder) == 20
+
+
+def test_chunk_to_frames_empty_remainder_slices_delta_directly() -> None:
+    remainder = bytearray()
+    data = bytes(i % 251 for i in range(500))
+    out = _chunk_to_frames(remainder, data, frame_bytes=160)
+    assert [len(f) for f in out] == [160, 160, 160]
+    assert all(type(f) is bytes for f in out)
+    assert bytes(remainder) == data[480:]
+
+    assert _chunk_to_frames(remainder, b"", frame_bytes=160) == []
+    assert _chunk_to_frames(bytearray(), b"z" * 40, frame_bytes=160) == []
+
+
+def test_twilio_media_payload_matches_json_parse() -> None:
+    media = {"track": "inbound", "chunk": "1", "timestamp": "5", "payload": "f/9+AA=="}
+    frame = {"event": "media", "sequenceNumber": "3", "media": media, "streamSid": "MZ1"}
+    for raw in (json.dumps(frame, separators=(",", ":")), json.dumps(frame)):
+        assert _twilio_media_payload(raw) == json.loads(raw)["media"]["payload"]
+
+    escaped = json.dumps({"event": "media", "media": {"payload": "f\\/9"}})
+    assert _twilio_media_payload(escaped) is None
+    assert _twilio_media_payload('{"event":"media","media":{"payload":null}}') is None
+    assert _twilio_media_payload('{"event":"start","start":{"mediaFormat":{}}}') is None
+    assert _twilio_media_payload(json.dumps({"event": "mark", "mark": {"name": "payload"}})) is None
+
+
+def test_pad_out_partial_frame_queues_silence_padded_tail() -> None:
+    buffers = OutgoingAudioBuffers()
+    assert _pad_out_partial_frame(buffers) is False
+    assert not buffers.main
+
+    _chunk_to_frames(buffers.remainder, b"\x01" * 200)
+    assert _pad_out_partial_frame(buffers) is True
+    assert list(buffers.main) == [b"\x01" * 40 + b"\xff" * 120]
+    assert not buffers.remainder
+    assert buffers.main_ready.is_set()
+
+
+def test_openai_append_text_matches_dumped_event() -> None:
+    for payload in ("AAEC/w==", 'x"}, "type": "session.update'):
+        assert json.loads(_openai_append_text(payload)) == {
+            "type": "input_audio_buffer.append",
+            "audio": payload,
+        }
+
+
+def test_coalesce_b64_audio_reencodes_padded_frames() -> None:
+    frames = [b"\x01" * 160, b"\x02" * 160, b"\x03" * 160]
+    payloads = [base64.b64encode(f).decode("ascii") for f in frames]
+    assert all(p.endswith("==") for p in payloads)
+    out, dropped = _coalesce_b64_audio(payloads)
+    assert base64.b64decode(out) == b"".join(frames)
+    assert dropped == 0
+
+
+def test_coalesce_b64_audio_counts_undecodable_payloads() -> None:
+    good = base64.b64encode(b"\x01" * 160).decode("ascii")
+    out, dropped = _coalesce_b64_audio([good, "A", good])
+    assert base64.b64decode(out) == b"\x01" * 320
+    assert dropped == 1
+
+
+def test_coalesce_b64_audio_single_and_unpadded_passthrough() -> None:
+    assert _coalesce_b64_audio(["abcd"]) == ("abcd", 0)
+    unpadded = [
+        base64.b64encode(b"x" * 162).decode("ascii"),
+        base64.b64encode(b"y" * 160).decode("ascii"),
+    ]
+    assert _coalesce_b64_audio(unpadded) == ("".join(unpadded), 0)
+
+
+def test_openai_append_batch_frames_env(monkeypatch) -> None:
+    monkeypatch.delenv("VOICE_OPENAI_APPEND_BATCH", raising=False)
+    assert _openai_append_batch_frames() == 4
+    monkeypatch.setenv("VOICE_OPENAI_APPEND_BATCH", "0")
+    assert _openai_append_batch_frames() == 1
+    monkeypatch.setenv("VOICE_OPENAI_APPEND_BATCH", "50")
+    assert _openai_append_batch_frames() == 10
+
+
+def test_inbound_media_ring_overwrites_oldest_and_batches_queued() -> None:
+    async def _run() -> tuple[list[str], list[str], int]:
+        ring = InboundMediaRing(3)
+        for p in ("a", "b", "c", "d"):
+            ring.put(p)
+        first = await ring.get_batch(2)
+        loop = asyncio.get_running_loop()
+        rest = await ring.get_batch(4)
+        loop.call_later(0.01, ring.put, "e")
+        late = await ring.get_batch(4)
+        return first + rest, late, ring.overwrites
+
+    drained, late, overwrites = asyncio.run(_run())
+    assert drained == ["b", "c", "d"]
+    assert late == ["e"]
+    assert overwrites == 1
+
+
+def _sender_loop_kwargs(monkeypatch, **cfg_overrides) -> dict:
+    monkeypatch.delenv("VOZLIA_DEBUG", raising=False)
+    cfg = dataclasses.replace(_load_flow_a_config(), **cfg_overrides)
+    return {
+        "out_q": asyncio.Queue(),
+        "stream_sid_ref": {"streamSid": "MZ1"},
+        "buffers": OutgoingAudioBuffers(),
+        "wait_ctl": WaitingAudioController(),
+        "response_state": ResponseState(),
+        "cfg": cfg,
+        "jitter": JitterEstimator(),
+    }
+
+
+def test_twilio_sender_loop_chunk_mode_wins_over_minimal_hot_path(monkeypatch) -> None:
+    minimal_calls: list[bool] = []
+
+    async def fake_minimal(**kwargs) -> None:
+        minimal_calls.append(kwargs["cfg"].chunk_mode)
+
+    monkeypatch.setattr(voice_flow_a, "_twilio_minimal_sender_loop", fake_minimal)
+
+    async def _run(chunk_mode: bool) -> None:
+        kwargs = _sender_loop_kwargs(monkeypatch, minimal_hot_path=True, chunk_mode=chunk_mode)
+        task = asyncio.create_task(voice_flow_a._twilio_sender_loop(**kwargs))
+        await asyncio.sleep(0.02)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(_run(chunk_mode=True))
+    assert minimal_calls == []
+    asyncio.run(_run(chunk_mode=False))
+    assert minimal_calls == [False]
+
+
+def test_twilio_sender_loop_paces_runway_after_startup_wait(monkeypatch) -> None:
+    kwargs = _sender_loop_kwargs(
+        monkeypatch,
+        chunk_mode=False,
+        minimal_hot_path=False,
+        adaptive_start=False,
+        high_water_frames=0,
+        playout_start_frames=3,
+        playout_refill_hold_s=0.0,
+    )
+    buffers = kwargs["buffers"]
+    kwargs["response_state"].active_response_id = "resp_1"
+
+    async def _run() -> list[float]:
+        loop = asyncio.get_running_loop()
+        task = asyncio.create_task(voice_flow_a._twilio_sender_loop(**kwargs))
+        buffers.main.append(b"\xff" * 160)
+        # Held by the startup runway for well under the catch-up window.
+        await asyncio.sleep(0.1)
+        buffers.main.extend([b"\xff" * 160] * 3)
+        buffers.main_ready.set()
+        sent_at = []
+        for _ in range(4):
+            await kwargs["out_q"].get()
+            sent_at.append(loop.time())
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return sent_at
+
+    sent_at = asyncio.run(_run())
+    gaps = [sent_at[i + 1] - sent_at[i] for i in range(len(sent_at) - 1)]
+    # Paced from the release, not sent back-to-back to catch up the 100 ms wait.
+    assert min(gaps) > 0.01
+
+
+def test_failed_writer_cancels_call_and_clean_exit_does_not() -> None:
+    class _BrokenSocket:
+        async def send_text(self, msg: str) -> None:
+            raise RuntimeError("socket gone")
+
+    async def _run() -> tuple[bool, bool]:
+        call = asyncio.create_task(asyncio.sleep(10))
+        out_q: asyncio.Queue[str] = asyncio.Queue()
+        writer = asyncio.create_task(voice_flow_a._twilio_writer_loop(websocket=_BrokenSocket(), out_q=out_q))
+        writer.add_done_callback(_cancel_on_failure(call))
+        await out_q.put("frame")
+        await asyncio.gather(writer, call, return_exceptions=True)
+
+        bystander = asyncio.create_task(asyncio.sleep(10))
+        stopped = asyncio.create_task(asyncio.sleep(10))
+        stopped.add_done_callback(_cancel_on_failure(bystander))
+        stopped.cancel()
+        await asyncio.gather(stopped, return_exceptions=True)
+        await asyncio.sleep(0)
+        cancelled_bystander = bystander.cancelled()
+        bystander.cancel()
+        return call.cancelled(), cancelled_bystander
+
+    call_cancelled, bystander_cancelled = asyncio.run(_run())
+    assert call_cancelled is True
+    assert bystander_cancelled is False
+
+
+def test_twilio_sender_loops_do_not_recreate_done_response_frame_counts(monkeypatch) -> None:
+    async def _run(minimal: bool) -> dict[str, int]:
+        kwargs = _sender_loop_kwargs(
+            monkeypatch,
+            chunk_mode=False,
+            minimal_hot_path=minimal,
+            adaptive_start=False,
+            high_water_frames=0,
+            playout_start_frames=1,
+            playout_refill_hold_s=0.0,
+        )
+        out_q: asyncio.Queue[str] = asyncio.Queue(maxsize=1)
+        await out_q.put("blocker")
+        kwargs["out_q"] = out_q
+        state = kwargs["response_state"]
+        state.active_response_id = "resp_1"
+        kwargs["buffers"].main.append(b"\xff" * 160)
+        task = asyncio.create_task(voice_flow_a._twilio_sender_loop(**kwargs))
+        # The sender is now parked in put(); response.done lands meanwhile.
+        await asyncio.sleep(0.01)
+        state.sent_main_frames_by_id.pop("resp_1", None)
+        state.active_response_id = None
+        await out_q.get()
+        await out_q.get()
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return state.sent_main_frames_by_id
+
+    assert asyncio.run(_run(minimal=False)) == {}
+    assert asyncio.run(_run(minimal=True)) == {}
+
+
+def test_twilio_sender_loop_reads_clock_once_per_tick(monkeypatch) -> None:
+    reads = 0
+
+    def counting_monotonic_ns() -> int:
+        nonlocal reads
+        reads += 1
+        return time.monotonic_ns()
+
+    monkeypatch.setattr(
+        voice_flow_a,
+        "time",
+        types.SimpleNamespace(monotonic=time.monotonic, monotonic_ns=counting_monotonic_ns),
+    )
+    kwargs = _sender_loop_kwargs(
+        monkeypatch,
+        chunk_mode=False,
+        minimal_hot_path=False,
+        adaptive_start=False,
+        high_water_frames=0,
+        playout_start_frames=1,
+        playout_refill_hold_s=0.0,
+    )
+    kwargs["response_state"].active_response_id = "resp_1"
+    kwargs["buffers"].main.extend([b"\xff" * 160] * 5)
+
+    async def _run() -> int:
+        task = asyncio.create_task(voice_flow_a._twilio_sender_loop(**kwargs))
+        for _ in range(5):
+            await kwargs["out_q"].get()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return reads
+
+    # One read at start, then per sending tick: one for send accounting and one after the send for pacing.
+    assert asyncio.run(_run()) == 1 + 2 * 5
+
+
+def test_inbound_media_ring_linger_fills_batch() -> None:
+    async def _run() -> tuple[list[str], list[str]]:
+        ring = InboundMediaRing(16)
+        loop = asyncio.get_running_loop()
+        ring.put("a")
+        loop.call_later(0.005, ring.put, "b")
+        loop.call_later(0.01, ring.put, "c")
+        lingered = await ring.get_batch(4, 0.05)
+        ring.put("d")
+        full = await ring.get_batch(1, 10.0)
+        ring.put("e")
+        loop.call_later(0.005, ring.put, "f")
+        started = loop.time()
+        filled = await ring.get_batch(2, 10.0)
+        assert loop.time() - started < 1.0
+        return lingered, full + filled
+
+    lingered, full = asyncio.run(_run())
+    assert lingered == ["a", "b", "c"]
+    # A batch that is already full never lingers; one that fills mid-linger returns at once.
+    assert full == ["d", "e", "f"]
+
+
+def test_openai_append_linger_env(monkeypatch) -> None:
+    monkeypatch.delenv("VOICE_OPENAI_APPEND_LINGER_MS", raising=False)
+    assert _openai_append_linger_s() == 0.0
+    monkeypatch.setenv("VOICE_OPENAI_APPEND_LINGER_MS", "40")
+    assert _openai_append_linger_s() == 0.04
+    monkeypatch.setenv("VOICE_OPENAI_APPEND_LINGER_MS", "5000")
+    assert _openai_append_linger_s() == 0.1
+
+
+def test_flow_a_event_queue_writes_in_order_off_loop(monkeypatch) -> None:
+    written: list[tuple[str, str, str, dict, str | None]] = []
+
+    def _fake_emit(tenant_id, rid, event_type, payload, trace_id=None, idempotency_key=None):
+        written.append((tenant_id, rid, event_type, payload, idempotency_key))
+        return "evt"
+
+    monkeypatch.setattr(voice_flow_a.core_db, "emit_event", _fake_emit)
+
+    async def _run() -> FlowAEventQueue:
+        events = FlowAEventQueue(enabled=True, maxlen=2)
+        for n in range(3):
+            events.emit(tenant_id="t1", rid="r1", event_type=f"flow_a.e{n}", payload={"n": n})
+        events.emit(tenant_id="", rid="r1", event_type="flow_a.skipped", payload={})
+        task = asyncio.create_task(events.run())
+        await asyncio.sleep(0)
+        events.emit(tenant_id="t1", rid="r1", event_type="flow_a.late", payload={}, idempotency_key="k")
+        events.close()
+        await asyncio.wait_for(task, timeout=2.0)
+        return events
+
+    events = asyncio.run(_run())
+    assert events.dropped == 1
+    assert [w[2] for w in written] == ["flow_a.e1", "flow_a.e2", "flow_a.late"]
+    assert written[0][3] == {"n": 1, "tenant_id": "t1", "rid": "r1"}
+    assert written[-1][4] == "k"
+
+
+def test_openai_message_item_text_matches_dict_encoding() -> None:
+    note = 'Caller interrupted; "stop" and listen.'
+    assert json.loads(_openai_message_item_text("system", note)) == {
+        "type": "conversation.item.create",
+        "item": {
+            "type": "message",
+            "role": "system",
+            "content": [{"type": "input_text", "text": note}],
+        },
+    }
+
+
+def test_rid_ring_evicts_oldest_past_maxlen() -> None:
+    ring = RidRing(maxlen=3)
+    for rid in ("r1", "r2", "r3", "r2", "r4"):
+        ring.add(rid)
+    assert len(ring) == 3
+    assert "r1" not in ring
+    assert all(r in ring for r in ("r2", "r3", "r4"))
+    ring.discard("r3")
+    ring.discard("missing")
+    assert "r3" not in ring
+    assert isinstance(ResponseState().processed_response_done_ids, RidRing)
+
+
+def test_load_flow_a_config_snapshots_env(monkeypatch) -> None:
+    monkeypatch.setenv("VOICE_TWILIO_CHUNK_MS", "60")
+    monkeypatch.setenv("VOICE_MAIN_MAX_FRAMES", "50")
+    monkeypatch.setenv("VOICE_BARGE_IN_MIN_FRAMES", "7")
+    cfg = _load_flow_a_config()
+    assert cfg.chunk_frames == 3
+    assert cfg.main_max_frames == 50
+    assert cfg.prebuffer_frames == 49
+    assert cfg.barge_in_min_frames == 7
+    monkeypatch.setenv("VOICE_BARGE_IN_MIN_FRAMES", "9")
+    assert cfg.barge_in_min_frames == 7
+    assert _load_flow_a_config().barge_in_min_frames == 9
+
+
+def test_load_flow_a_config_high_water_drop_default_off(monkeypatch) -> None:
+    monkeypatch.setenv("VOICE_MAIN_MAX_FRAMES", "200")
+    monkeypatch.delenv("VOICE_TWILIO_HIGH_WATER_DROP", raising=False)
+    assert _load_flow_a_config().high_water_frames == 0
+    monkeypatch.setenv("VOICE_TWILIO_HIGH_WATER_DROP", "1")
+    assert _load_flow_a_config().high_water_frames == 180
+
+
+def test_load_flow_a_config_diag_follows_debug_or_stats(monkeypatch) -> None:
+    monkeypatch.setenv("VOZLIA_DEBUG", "0")
+    monkeypatch.setenv("VOICE_TWILIO_STATS_LOG_ENABLED", "0")
+    assert _load_flow_a_config().diag_enabled is False
+    monkeypatch.setenv("VOICE_TWILIO_STATS_LOG_ENABLED", "1")
+    assert _load_flow_a_config().diag_enabled is True
+    monkeypatch.setenv("VOICE_TWILIO_STATS_LOG_ENABLED", "0")
+    monkeypatch.setenv("VOZLIA_DEBUG", "1")
+    assert _load_flow_a_config().diag_enabled is True
+
+
+def test_dbg_defers_formatting_until_debug(monkeypatch, caplog) -> None:
+    class _Loud:
+        def __str__(self) -> str:
+            raise AssertionError("formatted while debug is off")
+
+    monkeypatch.setenv("VOZLIA_DEBUG", "0")
+    _dbg("TWILIO_ADAPTIVE_DROP n=%d response_id=%s", 3, _Loud())
+    assert _load_flow_a_config().debug is False
+
+    monkeypatch.setenv("VOZLIA_DEBUG", "1")
+    with caplog.at_level("INFO", logger=voice_flow_a.logger.name):
+        _dbg("TWILIO_ADAPTIVE_DROP n=%d response_id=%s", 3, "resp_1")
+    assert "TWILIO_ADAPTIVE_DROP n=3 response_id=resp_1" in caplog.text
+    assert _load_flow_a_config().debug is True
+
+
+def test_openai_handled_event_types_reach_reader_dispatch(monkeypatch) -> None:
+    events = [
+        {"type": "session.created", "session": {}},
+        {"type": "session.updated", "session": {}},
+        {"type": "error", "error": {"code": "test_only"}},
+        {"type": "input_audio_buffer.speech_started"},
+        {"type": "input_audio_buffer.speech_stopped"},
+        {"type": "conversation.item.input_audio_transcription.completed", "transcript": "hello"},
+        {"type": "response.created", "response": {"id": "resp_1"}},
+        {"type": "response.output_text.delta", "response_id": "resp_1", "delta": "hi"},
+        {"type": "response.content_part.added", "response_id": "resp_1", "part": {"type": "audio"}},
+        {"type": "response.content_part.done", "response_id": "resp_1", "part": {"type": "audio"}},
+        {"type": "response.done", "response": {"id": "resp_1"}},
+        {"type": "response.output_audio_transcript.delta", "delta": "hi"},
+    ]
+    handled = OPENAI_HANDLED_EVENT_TYPES
+    assert {e["type"] for e in events[:-1]} == set(handled)
+    for evt in events:
+        assert _openai_event_skippable(json.dumps(evt, separators=(",", ":"))) is (evt["type"] not in handled)
+
+    gate_checks: list[tuple[str, bool]] = []
+
+    class _RecordingTypes(frozenset):
+        def __contains__(self, etype: object) -> bool:
+            hit = frozenset.__contains__(self, etype)
+            gate_checks.append((etype, hit))
+            return hit
+
+    monkeypatch.setattr(voice_flow_a, "OPENAI_HANDLED_EVENT_TYPES", _RecordingTypes(handled))
+    # Skippable frames never reach the reader's gate, so feed only the handled ones.
+    _run_twilio_stream_with_openai_events(monkeypatch, events[:-1])
+
+    assert gate_checks == [(e["type"], True) for e in events[:-1]]
+
+
+def test_openai_response_create_text_requests_audio_and_text() -> None:
+    assert json.loads(OPENAI_RESPONSE_CREATE_TEXT) == {
+        "type": "response.create",
+        "response": {"modalities": ["audio", "text"]},
+    }
+
+
+def test_openai_event_skippable_only_trusts_leading_type() -> None:
+    assert _openai_event_skippable(b'{"type":"response.output_audio_transcript.delta","delta":"hi"}') is True
+    assert _openai_event_skippable('{"type":"rate_limits.updated","rate_limits":[]}') is True
+    assert _openai_event_skippable(b'{"type":"response.output_audio.delta","delta":"AA=="}') is False
+    assert _openai_event_skippable(b'{"type":"response.done","response":{}}') is False
+    assert _openai_event_skippable(b'{"event_id":"e1","type":"response.done"}') is False
+    assert _openai_event_skippable(b'{"item":{"type":"message"},"type":"error"}') is False
+
+
+def test_ws_recv_supports_raw_detects_decode_kwarg() -> None:
+    class _NewWs:
+        async def recv(self, decode: bool | None = None) -> str:
+            return ""
+
+    class _OldWs:
+        async def recv(self) -> str:
+            return ""
+
+    assert _ws_recv_supports_raw(_NewWs()) is True
+    assert _ws_recv_supports_raw(_OldWs()) is False
+
+
+def test_outgoing_audio_buffers_main_lane_drops_oldest_at_capacity() -> None:
+    buffers = OutgoingAudioBuffers(main_max_frames=3)
+    buffers.main.extend([b"a" * 160, b"b" * 160, b"c" * 160, b"d" * 160])
+    assert list(buffers.main) == [b"b" * 160, b"c" * 160, b"d" * 160]
+    assert buffers.main.maxlen == 3
+
+
+def test_wait_for_main_audio_wakes_on_append_before_timeout() -> None:
+    async def _run() -> tuple[float, float]:
+        loop = asyncio.get_running_loop()
+        buffers = OutgoingAudioBuffers()
+
+        def _append() -> None:
+            buffers.main.append(b"x" * 160)
+            buffers.main_ready.set()
+
+        loop.call_later(0.01, _append)
+        t0 = loop.time()
+        await _wait_for_main_audio(buffers, 5.0)
+        woke = loop.time() - t0
+
+        t0 = loop.time()
+        await _wait_for_main_audio(buffers, 0.02)
+        return woke, loop.time() - t0
+
+    woke, idle = asyncio.run(_run())
+    assert woke < 1.0
+    assert idle >= 0.015
+
+
 def test_audio_queue_bytes_counts_main_aux_and_remainder() -> None:
     buffers = OutgoingAudioBuffers()
     buffers.main.extend([b"a" * 160, b"b" * 160])
@@ -115,27 +656,37 @@ def test_flush_output_audio_buffers_clears_all_lanes_and_remainder() -> None:
     assert len(buffers.remainder) == 0
 
 
+def test_response_state_turn_log_resets_by_replacement() -> None:
+    state = ResponseState()
+    state.turn_log.first_audio = True
+    state.turn_log.first_main = True
+    state.turn_log = TurnLog()
+    assert state.turn_log.first_audio is False
+    assert state.turn_log.first_main is False
+    assert ResponseState().turn_log is not ResponseState().turn_log
+
+
 def test_is_sender_underrun_state_active_response() -> None:
     buffers = OutgoingAudioBuffers()
-    state = {"active_response_id": "resp_123"}
+    state = ResponseState(active_response_id="resp_123")
     assert _is_sender_underrun_state(response_state=state, buffers=buffers) is True
 
 
 def test_is_sender_underrun_state_idle_silence() -> None:
     buffers = OutgoingAudioBuffers()
-    state = {"active_response_id": None}
+    state = ResponseState()
     assert _is_sender_underrun_state(response_state=state, buffers=buffers) is False
 
 
 def test_is_sender_underrun_state_buffered_main_without_active_response() -> None:
     buffers = OutgoingAudioBuffers()
     buffers.main.append(b"x" * 160)
-    state = {"active_response_id": None}
+    state = ResponseState()
     assert _is_sender_underrun_state(response_state=state, buffers=buffers) is True
 
 
 def test_diag_score_ok_for_varied_audio() -> None:
-    diag = _diag_init()
+    diag = AudioDiag()
     prev = None
     for i in range(40):
         frame = bytes((j + i) % 256 for j in range(160))
@@ -145,7 +696,7 @@ def test_diag_score_ok_for_varied_audio() -> None:
 
 
 def test_diag_score_bad_for_highly_repetitive_audio() -> None:
-    diag = _diag_init()
+    diag = AudioDiag()
     frame = b"\xff" * 160
     prev = None
     for _ in range(120):
@@ -154,6 +705,29 @@ def test_diag_score_bad_for_highly_repetitive_audio() -> None:
     assert _diag_score(diag) == "bad"
 
 
+def test_diag_update_frames_matches_per_frame_updates() -> None:
+    silence = b"\xff" * 160
+    varied = bytes(range(160))
+    deltas = [[silence, silence, varied], [varied, varied], [], [silence]]
+    per_frame = AudioDiag()
+    batched = AudioDiag()
+    prev_a: bytes | None = None
+    prev_b: bytes | None = None
+    for frames in deltas:
+        for f in frames:
+            _diag_update_frame(per_frame, f, prev_a)
+            prev_a = f
+        prev_b = _diag_update_frames(batched, frames, prev_b)
+    assert batched == per_frame
+    assert prev_b == prev_a
+
+
+def test_byte_diversity_matches_set_size_up_to_three() -> None:
+    frames = [b"", b"\xff" * 160, b"\xff\x7f" * 80, b"\x00" * 159 + b"\x01", bytes(range(160))]
+    for frame in frames:
+        assert _byte_diversity(frame) == min(3, len(set(frame)))
+
+
 def test_vad_speech_started_debounce_env_default(monkeypatch) -> None:
     monkeypatch.delenv("VOICE_VAD_SPEECH_STARTED_DEBOUNCE_MS", raising=False)
     assert _speech_started_debounce_s() == 0.3
@@ -239,6 +813,51 @@ def test_playout_low_water_frames_defaults_off_and_clamps(monkeypatch) -> None:
     assert _playout_low_water_frames(24) == 24
 
 
+def test_jitter_estimator_defaults_to_configured_runway_without_samples() -> None:
+    est = JitterEstimator()
+    assert est.target_start_frames(24) == 24
+    est.observe(1_000_000_000, 320)
+    assert est.target_start_frames(24) == 24
+
+
+def test_jitter_estimator_shrinks_runway_for_steady_deltas() -> None:
+    est = JitterEstimator()
+    t = 0
+    for _ in range(50):
+        est.observe(t, 320)
+        t += 40_000_000
+    assert 4 <= est.target_start_frames(24) < 24
+
+
+def test_jitter_estimator_grows_runway_for_small_deltas_at_steady_gaps() -> None:
+    est = JitterEstimator()
+    t = 0
+    # Evenly spaced 40 ms apart but carrying 10 ms of audio each: playout would starve.
+    for _ in range(50):
+        est.observe(t, 80)
+        t += 40_000_000
+    assert est.target_start_frames(24) == 24
+
+
+def test_jitter_estimator_clamps_bursty_deltas_and_resets_gap_per_response() -> None:
+    est = JitterEstimator()
+    t = 0
+    for i in range(50):
+        est.observe(t, 320)
+        t += 20_000_000 if i % 2 else 400_000_000
+    assert est.target_start_frames(24) == 24
+    est.on_response_start()
+    est.observe(t + 10_000_000_000, 320)
+    assert est.target_start_frames(24) == 24
+
+
+def test_adaptive_playout_start_default_off(monkeypatch) -> None:
+    monkeypatch.delenv("VOICE_TWILIO_ADAPTIVE_START", raising=False)
+    assert _adaptive_playout_start_enabled() is False
+    monkeypatch.setenv("VOICE_TWILIO_ADAPTIVE_START", "1")
+    assert _adaptive_playout_start_enabled() is True
+
+
 def test_playout_refill_hold_seconds(monkeypatch) -> None:
     monkeypatch.delenv("VOICE_TWILIO_REFILL_HOLD_MS", raising=False)
     assert _playout_refill_hold_s() == 0.0
@@ -259,12 +878,10 @@ def test_should_accept_response_audio_requires_active_response() -> None:
 
 
 def test_barge_in_allowed_requires_min_age_and_frames() -> None:
-    state = {"sent_main_frames_by_id": {"resp_1": 12}}
-    started = {"resp_1": 100.0}
+    state = ResponseState(started_at_by_id={"resp_1": 100.0}, sent_main_frames_by_id={"resp_1": 12})
     assert (
         _barge_in_allowed(
             active_response_id="resp_1",
-            response_started_at=started,
             response_state=state,
             now_monotonic=100.2,
             min_response_ms=450,
@@ -272,11 +889,10 @@ def test_barge_in_allowed_requires_min_age_and_frames() -> None:
         )
         is False
     )
-    state["sent_main_frames_by_id"]["resp_1"] = 16
+    state.sent_main_frames_by_id["resp_1"] = 16
     assert (
         _barge_in_allowed(
             active_response_id="resp_1",
-            response_started_at=started,
             response_state=state,
             now_monotonic=100.5,
             min_response_ms=450,
@@ -323,6 +939,42 @@ def test_twilio_mark_enabled_env(monkeypatch) -> None:
     assert _twilio_mark_enabled() is False
 
 
+def test_twilio_media_envelope_matches_built_msg() -> None:
+    frame = bytes(range(160))
+    prefix, suffix = _twilio_media_envelope("MZ123")
+    payload = base64.b64encode(frame).decode("ascii")
+    assert json.loads(f"{prefix}{payload}{suffix}") == {
+        "event": "media",
+        "streamSid": "MZ123",
+        "media": {"payload": payload},
+    }
+    mark = f'{_twilio_mark_prefix("MZ123")}7"}}}}'
+    assert json.loads(mark) == _build_twilio_mark_msg("MZ123", "m7")
+    assert json.loads(_twilio_clear_text("MZ123")) == _build_twilio_clear_msg("MZ123")
+
+
+def test_twilio_writer_loop_sends_queued_frames_in_order() -> None:
+    sent: list[str] = []
+
+    class _FakeWebSocket:
+        async def send_text(self, msg: str) -> None:
+            sent.append(msg)
+
+    async def _run() -> None:
+        out_q: asyncio.Queue[str] = asyncio.Queue()
+        for msg in ("media-1", "clear", "media-2"):
+            out_q.put_nowait(msg)
+        task = asyncio.create_task(
+            voice_flow_a._twilio_writer_loop(websocket=_FakeWebSocket(), out_q=out_q)
+        )
+        while len(sent) < 3:
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(_run())
+    assert sent == ["media-1", "clear", "media-2"]
+
+
 def test_build_openai_session_update_uses_legacy_ulaw_session_schema() -> None:
     msg = _build_openai_session_update(voice="marin", instructions="Be brief.")
 
@@ -619,9 +1271,9 @@ def test_emit_flow_a_event_kill_switch_off_makes_no_db_calls(monkeypatch) -> Non
     monkeypatch.setattr(voice_flow_a.core_db, "emit_event", _fake_emit_event)
     assert voice_flow_a._event_emit_enabled() is False
 
-    asyncio.run(
-        voice_flow_a._emit_flow_a_event(
-            enabled=voice_flow_a._event_emit_enabled(),
+    async def _run() -> None:
+        events = FlowAEventQueue(enabled=voice_flow_a._event_emit_enabled())
+        events.emit(
             tenant_id="tenant_demo",
             rid="rid-123",
             event_type="flow_a.call_started",
@@ -632,7 +1284,10 @@ def test_emit_flow_a_event_kill_switch_off_makes_no_db_calls(monkeypatch) -> Non
                 "tenant_mode": "owner",
             },
         )
-    )
+        events.close()
+        await events.run()
+
+    asyncio.run(_run())
 
     assert calls == []
 
@@ -655,9 +1310,9 @@ def test_emit_flow_a_event_kill_switch_on_emits_expected_tuple(monkeypatch) -> N
     monkeypatch.setattr(voice_flow_a.core_db, "emit_event", _fake_emit_event)
     assert voice_flow_a._event_emit_enabled() is True
 
-    asyncio.run(
-        voice_flow_a._emit_flow_a_event(
-            enabled=voice_flow_a._event_emit_enabled(),
+    async def _run() -> None:
+        events = FlowAEventQueue(enabled=voice_flow_a._event_emit_enabled())
+        events.emit(
             tenant_id="tenant_demo",
             rid="rid-456",
             event_type="flow_a.call_started",
@@ -668,7 +1323,10 @@ def test_emit_flow_a_event_kill_switch_on_emits_expected_tuple(monkeypatch) -> N
                 "tenant_mode": "customer",
             },
         )
-    )
+        events.close()
+        await events.run()
+
+    asyncio.run(_run())
 
     assert calls == [("tenant_demo", "rid-456", "flow_a.call_started")]
 
@@ -719,3 +1377,163 @@ def test_lifecycle_event_payload_missing_numbers_become_none() -> None:
     assert payload["from_number"] is None
     assert payload["to_number"] is None
     assert "reason" not in payload
+
+
+def test_parse_twilio_start_normalizes_fields() -> None:
+    info = _parse_twilio_start(
+        {
+            "event": "start",
+            "start": {
+                "streamSid": "MZ123",
+                "callSid": "CA123",
+                "customParameters": {
+                    "tenant_id": "tenant_demo",
+                    "tenant_mode": "shared",
+                    "ai_mode": " Owner ",
+                    "from_number": "+15180001111",
+                    "to_number": 5180002222,
+                },
+            },
+        }
+    )
+    assert info.stream_sid == "MZ123"
+    assert info.call_sid == "CA123"
+    assert info.rid == "CA123"
+    assert info.tenant_id == "tenant_demo"
+    assert info.tenant_mode == "shared"
+    assert info.ai_mode == "owner"
+    assert info.from_number == "+15180001111"
+    assert info.to_number is None
+    assert info.custom["tenant_id"] == "tenant_demo"
+
+    empty = _parse_twilio_start({"event": "start", "start": {"customParameters": {"rid": "r1", "tenant_id": " "}}})
+    assert empty.rid == "r1"
+    assert empty.tenant_id is None
+    assert empty.ai_mode == "customer"
+    assert _parse_twilio_start({"event": "start"}).custom == {}
+
+
+def test_connect_openai_ws_reuses_module_ssl_context(monkeypatch) -> None:
+    import websockets
+
+    seen: list[dict] = []
+
+    async def fake_connect(uri, *, additional_headers=None, max_size=None, **kwargs):
+        seen.append({"uri": uri, "max_size": max_size, **kwargs})
+        return object()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(websockets, "connect", fake_connect)
+    asyncio.run(voice_flow_a._connect_openai_ws(model="gpt-realtime"))
+    asyncio.run(voice_flow_a._connect_openai_ws(model="gpt-realtime"))
+
+    assert [c["ssl"] for c in seen] == [voice_flow_a.OPENAI_SSL_CONTEXT] * 2
+    assert seen[0]["max_size"] == voice_flow_a.OPENAI_WS_MAX_SIZE
+    assert seen[0]["uri"].startswith("wss://")
+
+
+def _run_twilio_stream_with_openai_events(monkeypatch, events: list[dict], before_event=None) -> list[ResponseState]:
+    """Drive twilio_stream through a Twilio start, then feed events from a fake OpenAI socket."""
+    monkeypatch.setenv("VOZ_FEATURE_VOICE_FLOW_A", "1")
+    monkeypatch.setenv("VOZ_FLOW_A_OPENAI_BRIDGE", "1")
+    states: list[ResponseState] = []
+
+    def _capture_state() -> ResponseState:
+        states.append(ResponseState())
+        return states[-1]
+
+    monkeypatch.setattr(voice_flow_a, "ResponseState", _capture_state)
+    pending = list(events)
+
+    class _OpenAI:
+        def __init__(self) -> None:
+            self.finished = asyncio.Event()
+
+        async def send(self, msg: str) -> None:
+            return None
+
+        async def close(self) -> None:
+            return None
+
+        async def recv(self) -> str:
+            if not pending:
+                self.finished.set()
+                await asyncio.Event().wait()
+            evt = pending.pop(0)
+            if before_event is not None:
+                before_event(evt, states[0])
+            return json.dumps(evt)
+
+    openai_ws = _OpenAI()
+
+    async def _fake_connect(*, model: str) -> _OpenAI:
+        return openai_ws
+
+    monkeypatch.setattr(voice_flow_a, "_connect_openai_ws", _fake_connect)
+
+    class _Twilio:
+        client_state = WebSocketState.CONNECTED
+
+        def __init__(self) -> None:
+            self._started = False
+
+        async def accept(self) -> None:
+            return None
+
+        async def receive_text(self) -> str:
+            if not self._started:
+                self._started = True
+                return json.dumps({"event": "start", "start": {"streamSid": "MZ1", "callSid": "CA1"}})
+            await openai_ws.finished.wait()
+            raise WebSocketDisconnect()
+
+        async def send_text(self, msg: str) -> None:
+            return None
+
+        async def close(self, code: int = 1000) -> None:
+            return None
+
+    asyncio.run(asyncio.wait_for(voice_flow_a.twilio_stream(_Twilio()), 5))
+    return states
+
+
+def test_response_done_for_superseded_response_drops_its_state(monkeypatch) -> None:
+    def _before(evt: dict, state: ResponseState) -> None:
+        if evt["type"] == "response.done":
+            # resp_a played (and held for refill) before resp_b superseded it.
+            state.sent_main_frames_by_id["resp_a"] = 3
+            state.refill_wait_started_by_id["resp_a"] = 1
+
+    states = _run_twilio_stream_with_openai_events(
+        monkeypatch,
+        [
+            {"type": "response.created", "response": {"id": "resp_a"}},
+            {"type": "response.created", "response": {"id": "resp_b"}},
+            {"type": "response.done", "response": {"id": "resp_a"}},
+        ],
+        before_event=_before,
+    )
+
+    state = states[0]
+    assert state.active_response_id == "resp_b"
+    assert "resp_a" not in state.started_at_by_id
+    assert "resp_a" not in state.sent_main_frames_by_id
+    assert "resp_a" not in state.refill_wait_started_by_id
+    assert "resp_b" in state.started_at_by_id
+
+
+def test_load_flow_a_config_heartbeat_and_force_commit(monkeypatch) -> None:
+    monkeypatch.setenv("VOICE_SPEECH_CTRL_HEARTBEAT_MS", "100")
+    monkeypatch.setenv("VOICE_FORCE_INPUT_COMMIT_MS", "900")
+    monkeypatch.setenv("VOICE_FORCE_INPUT_COMMIT_MIN_FRAMES", "0")
+    monkeypatch.setenv("VOICE_FORCE_INPUT_COMMIT_FALLBACK", "0")
+    cfg = _load_flow_a_config()
+    assert cfg.speech_ctrl_heartbeat_s == 0.5
+    assert cfg.force_input_commit_after_s == 0.9
+    assert cfg.force_input_commit_min_frames == 1
+    assert cfg.force_input_commit_enabled is False
+
+
+def test_dbg_call_sites_use_lazy_args() -> None:
+    source = inspect.getsource(voice_flow_a)
+    assert not re.findall(r"_dbg\(\s*f[\"']", source)